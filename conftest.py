@@ -1,10 +1,18 @@
 """Root pytest configuration.
 
 This file adds the --skip-integration option for skipping integration tests in CI.
+Integration test modules are not even collected when the option is set.
+On platforms without a Spotify controller, integration tests are skipped
+before any of their fixtures run.
 """
 
+import os
+
 import pytest
 
+# Run the spotify.py entrypoint with a normal interpreter shutdown under test
+os.environ.setdefault("SPOTIFY_RPA_CLEAN_EXIT", "1")
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -22,12 +30,43 @@ def pytest_configure(config):
         "markers",
         "integration: mark test as integration test (requires real Spotify)"
     )
+    # Registered here too so the marker is known when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests of the same group on one xdist worker"
+    )
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Do not import integration test modules when they are being skipped."""
+    if config.getoption("--skip-integration"):
+        if collection_path.name.startswith("test_integration"):
+            return True
+    return None
 
 
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection based on command line options."""
+    """Deselect or skip integration tests that cannot run here."""
     if config.getoption("--skip-integration"):
-        skip_integration = pytest.mark.skip(reason="--skip-integration flag set")
+        selected = []
+        deselected = []
+        for item in items:
+            if "integration" in item.keywords:
+                deselected.append(item)
+            else:
+                selected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        return
+    
+    from spotify_rpa.controller import get_platform
+    
+    current_platform = get_platform()
+    if current_platform not in ("macos", "windows"):
+        skip = pytest.mark.skip(
+            reason=f"Integration tests not supported on {current_platform}"
+        )
         for item in items:
             if "integration" in item.keywords:
-                item.add_marker(skip_integration)
+                item.add_marker(skip)
@@ -11,8 +11,15 @@ Usage:
     python spotify.py --help
 """
 
+import os
 import sys
 from spotify_rpa import main
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_code = main()
+    if os.environ.get("SPOTIFY_RPA_CLEAN_EXIT"):
+        sys.exit(exit_code)
+    # Skip interpreter teardown; main() has already released its resources
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
@@ -19,7 +19,7 @@ Author: Mika Hänninen
 License: MIT
 """
 
-from .models import TrackInfo
+from .models import StatusSnapshot, TrackInfo
 from .exceptions import (
     SpotifyRPAError,
     PlatformNotSupportedError,
@@ -27,8 +27,29 @@ from .exceptions import (
     AppleScriptError,
     SpotifyNotRunningError,
 )
-from .controller import SpotifyRPA, get_platform, create_spotify_controller
-from .cli import main
+
+# Heavier symbols are imported on first access (PEP 562) so that importing
+# models or exceptions does not load the controller and CLI modules.
+_LAZY_IMPORTS = {
+    "SpotifyRPA": ".controller",
+    "create_spotify_controller": ".controller",
+    "get_platform": ".controller",
+    "main": ".cli",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Main class
@@ -38,6 +59,7 @@ __all__ = [
     "get_platform",
     # Models
     "TrackInfo",
+    "StatusSnapshot",
     # Exceptions
     "SpotifyRPAError",
     "PlatformNotSupportedError",
@@ -1,10 +1,25 @@
 """Abstract base class for platform-specific Spotify controllers."""
 
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
-from .models import TrackInfo
+from .models import StatusSnapshot, TrackInfo
+
+__all__ = ["KeyPress", "SpotifyControllerBase"]
+
+# A key code, optionally paired with modifiers such as ["shift"]
+KeyPress = Union[int, Tuple[int, List[str]]]
+
+
+def _print_debug(message: str, *args) -> None:
+    """Print a debug message, applying %-style arguments."""
+    print(message % args if args else message)
+
+
+def _discard_debug(message: str, *args) -> None:
+    """Drop a debug message without formatting it."""
 
 
 class SpotifyControllerBase(ABC):
@@ -15,12 +30,40 @@ class SpotifyControllerBase(ABC):
     the abstract methods.
     """
     
+    # Controllers are long-lived and hit their attributes on every command,
+    # so instance state lives in slots rather than a per-instance __dict__.
+    # Subclasses declare their own attributes in their own __slots__.
+    __slots__ = (
+        "_debug",
+        "_log",
+        "_ui_delay",
+        "_kc_return",
+        "_kc_escape",
+        "_kc_tab",
+        "_kc_down",
+        "_kc_up",
+        "_kc_space",
+        "_cmd_mod",
+        "_watcher",
+        "_watcher_stop",
+        "_watch_interval",
+        "_watch_condition",
+        "_watch_callbacks",
+        "_watched_snapshot",
+        "_track_changes",
+    )
+    
     # Default delays for UI operations (in seconds)
     DEFAULT_LAUNCH_DELAY = 2.0
     DEFAULT_UI_DELAY = 0.5
     DEFAULT_SEARCH_DELAY = 1.5
+    DEFAULT_OVERLAY_DELAY = 0.1
     DEFAULT_KEYSTROKE_DELAY = 0.1
     
+    # Exponential backoff used when polling for a state change (in seconds)
+    POLL_INITIAL_DELAY = 0.05
+    POLL_MAX_DELAY = 1.5
+    
     def __init__(self, debug: bool = False):
         """
         Initialize the controller.
@@ -30,6 +73,36 @@ class SpotifyControllerBase(ABC):
         """
         self.debug = debug
         self._ui_delay = self.DEFAULT_UI_DELAY
+        
+        # Key codes and modifiers are constant per platform; resolve them once
+        self._kc_return = self._get_return_key_code()
+        self._kc_escape = self._get_escape_key_code()
+        self._kc_tab = self._get_tab_key_code()
+        self._kc_down = self._get_down_arrow_key_code()
+        self._kc_up = self._get_up_arrow_key_code()
+        self._kc_space = self._get_space_key_code()
+        self._cmd_mod = self._get_command_modifier()
+        
+        # State shared with the background watcher thread, see start_watcher()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self._watch_interval = 0.0
+        self._watch_condition = threading.Condition()
+        self._watch_callbacks: List[Callable[[StatusSnapshot], None]] = []
+        self._watched_snapshot: Optional[StatusSnapshot] = None
+        self._track_changes = 0
+    
+    @property
+    def debug(self) -> bool:
+        """Whether debug information is printed."""
+        return self._debug
+    
+    @debug.setter
+    def debug(self, enabled: bool) -> None:
+        self._debug = enabled
+        # Bind the logger once so hot paths neither branch on the flag nor
+        # format messages that are going to be dropped
+        self._log = _print_debug if enabled else _discard_debug
     
     # =========================================================================
     # Abstract Methods - Must be implemented by platform-specific classes
@@ -128,7 +201,7 @@ class SpotifyControllerBase(ABC):
         """Send a key code to Spotify."""
     
     @abstractmethod
-    def _type_text(self, text: str, delay_per_char: float = 0.02) -> None:
+    def _type_text(self, text: str, delay_per_char: float = 0.0) -> None:
         """Type text into Spotify."""
     
     @abstractmethod
@@ -167,6 +240,86 @@ class SpotifyControllerBase(ABC):
         """Check if Spotify is currently playing."""
         return self.get_player_state() == "playing"
     
+    def wait_for(
+        self,
+        predicate: Callable[[], bool],
+        timeout: float,
+        initial: Optional[float] = None
+    ) -> bool:
+        """
+        Poll a predicate with exponential backoff until it holds.
+        
+        Used by every wait in the package, so callers waiting on their own
+        conditions back off the same way.
+        
+        Args:
+            predicate: Callable returning True once the awaited state is reached.
+            timeout: Maximum time to wait in seconds.
+            initial: First delay between polls (defaults to POLL_INITIAL_DELAY).
+        
+        Returns:
+            True if the predicate held before the timeout expired.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial or self.POLL_INITIAL_DELAY
+        while not predicate():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.POLL_MAX_DELAY)
+        return True
+    
+    def wait_until_playing(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for playback to start.
+        
+        Args:
+            timeout: Maximum time to wait in seconds.
+        
+        Returns:
+            True if Spotify is playing before the timeout expires.
+        """
+        return self.wait_for(self.is_playing, timeout)
+    
+    def get_status_snapshot(self) -> StatusSnapshot:
+        """
+        Get player state, current track and position together.
+        
+        Platforms that can fetch everything in a single query should
+        override this; the default issues one query per value.
+        """
+        state = self.get_player_state()
+        if state == "stopped":
+            return StatusSnapshot(state=state)
+        return StatusSnapshot(
+            state=state,
+            track=self.get_current_track(),
+            position=self.get_player_position(),
+        )
+    
+    def get_status_bundle(self) -> Tuple[StatusSnapshot, int]:
+        """
+        Get the status snapshot and the volume together.
+        
+        Platforms that can fetch both in a single query should override this.
+        
+        Returns:
+            A (snapshot, volume) tuple.
+        """
+        return self.get_status_snapshot(), self.get_volume()
+    
+    async def get_status_bundle_async(self) -> Tuple[StatusSnapshot, int]:
+        """
+        Get the status snapshot and the volume without blocking the event loop.
+        
+        The queries run in a worker thread, so other coroutines keep running
+        while Spotify answers.
+        """
+        # asyncio pulls in ssl, socket and logging; only async callers pay for it
+        import asyncio
+        return await asyncio.to_thread(self.get_status_bundle)
+    
     def wait(self, seconds: float) -> None:
         """Wait for a specified number of seconds."""
         time.sleep(seconds)
@@ -175,29 +328,198 @@ class SpotifyControllerBase(ABC):
         """Set the default delay for UI operations."""
         self._ui_delay = delay
     
+    def close(self) -> None:
+        """Release any resources held by the controller."""
+        self.stop_watcher()
+    
+    # =========================================================================
+    # Change Watching
+    # =========================================================================
+    
+    def start_watcher(self, interval: float = 1.0) -> None:
+        """
+        Poll Spotify in a background thread and report changes.
+        
+        One thread polls the status snapshot every interval, so any number of
+        callers can wait on changes without each querying Spotify.
+        Does nothing if the watcher is already running.
+        
+        Args:
+            interval: Seconds between polls.
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher_stop.clear()
+        self._watch_interval = interval
+        self._watcher = threading.Thread(
+            target=self._watch,
+            args=(interval,),
+            name="spotify-rpa-watcher",
+            daemon=True,
+        )
+        self._watcher.start()
+    
+    def stop_watcher(self) -> None:
+        """
+        Stop the background watcher thread, if running.
+        
+        Waits up to two polling intervals for the thread to finish. A poll
+        stuck in Spotify is left behind; the thread is a daemon and exits
+        once the poll returns.
+        """
+        watcher, self._watcher = self._watcher, None
+        if watcher is None:
+            return
+        self._watcher_stop.set()
+        if watcher is not threading.current_thread():
+            watcher.join(2 * self._watch_interval)
+    
+    def add_watch_callback(self, callback: Callable[[StatusSnapshot], None]) -> None:
+        """
+        Register a callback for changes seen by the watcher.
+        
+        The callback runs on the watcher thread with the new snapshot
+        whenever the player state or the current track changes. Exceptions
+        it raises are logged and do not stop the watcher.
+        """
+        self._watch_callbacks.append(callback)
+    
+    def wait_for_track_change(self, timeout: float = 30.0) -> bool:
+        """
+        Wait until the watcher sees a different track.
+        
+        Starts the watcher with its default interval if it is not running.
+        
+        Args:
+            timeout: Maximum time to wait in seconds.
+        
+        Returns:
+            True if the track changed before the timeout expired.
+        """
+        self.start_watcher()
+        with self._watch_condition:
+            seen = self._track_changes
+            return self._watch_condition.wait_for(
+                lambda: self._track_changes != seen, timeout
+            )
+    
+    def _watch(self, interval: float) -> None:
+        """Watcher thread body: poll until stopped, publishing changes."""
+        stop = self._watcher_stop
+        while True:
+            # Any failure only costs this poll; the thread must keep running
+            # or every later change would go unreported
+            try:
+                snapshot = self.get_status_snapshot()
+            except Exception as e:
+                self._log("[Watcher] poll failed: %r", e)
+                snapshot = None
+            if snapshot is not None:
+                self._publish(snapshot)
+            if stop.wait(interval):
+                return
+    
+    def _publish(self, snapshot: StatusSnapshot) -> None:
+        """Record a polled snapshot and notify waiters if it changed."""
+        with self._watch_condition:
+            previous = self._watched_snapshot
+            self._watched_snapshot = snapshot
+            if previous is None:
+                # First poll only sets the baseline
+                return
+            track_changed = snapshot.track != previous.track
+            if not track_changed and snapshot.state == previous.state:
+                return
+            if track_changed:
+                self._track_changes += 1
+                self._watch_condition.notify_all()
+        for callback in list(self._watch_callbacks):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                self._log("[Watcher] callback %r failed: %r", callback, e)
+    
     def _press_return(self) -> None:
         """Press the Return/Enter key."""
-        self._key_code(self._get_return_key_code())
+        self._key_code(self._kc_return)
     
     def _press_escape(self) -> None:
         """Press the Escape key."""
-        self._key_code(self._get_escape_key_code())
+        self._key_code(self._kc_escape)
     
     def _press_tab(self) -> None:
         """Press the Tab key."""
-        self._key_code(self._get_tab_key_code())
+        self._key_code(self._kc_tab)
     
     def _press_down_arrow(self) -> None:
         """Press the Down Arrow key."""
-        self._key_code(self._get_down_arrow_key_code())
+        self._key_code(self._kc_down)
     
     def _press_up_arrow(self) -> None:
         """Press the Up Arrow key."""
-        self._key_code(self._get_up_arrow_key_code())
+        self._key_code(self._kc_up)
     
     def _press_space(self) -> None:
         """Press the Space key."""
-        self._key_code(self._get_space_key_code())
+        self._key_code(self._kc_space)
+    
+    def _send_key_sequence(
+        self,
+        keys: Sequence[KeyPress],
+        delay: Optional[float] = None,
+        final_delay: Optional[float] = None
+    ) -> None:
+        """
+        Press a sequence of keys.
+        
+        Platforms that can send several keys in one automation call should
+        override this.
+        
+        Args:
+            keys: Key codes, or (key code, modifiers) tuples.
+            delay: Seconds to wait after each key (defaults to DEFAULT_KEYSTROKE_DELAY).
+            final_delay: Seconds to wait after the last key (defaults to delay).
+        """
+        for code, modifiers, wait in self._key_sequence_steps(keys, delay, final_delay):
+            self._key_code(code, modifiers)
+            time.sleep(wait)
+    
+    def _key_sequence_steps(
+        self,
+        keys: Sequence[KeyPress],
+        delay: Optional[float],
+        final_delay: Optional[float]
+    ) -> List[Tuple[int, Optional[list], float]]:
+        """Resolve a key sequence into (key code, modifiers, delay after) steps."""
+        if delay is None:
+            delay = self.DEFAULT_KEYSTROKE_DELAY
+        if final_delay is None:
+            final_delay = delay
+        steps = []
+        for index, key in enumerate(keys, 1):
+            code, modifiers = key if isinstance(key, tuple) else (key, None)
+            steps.append((code, modifiers, final_delay if index == len(keys) else delay))
+        return steps
+    
+    def _search_has_results(self) -> bool:
+        """
+        Check whether the quick search overlay lists any results.
+        
+        Platforms that can inspect the UI override this. The default never
+        reports results, so waits on it last for their full timeout.
+        """
+        return False
+    
+    def _open_search_uri(self, query: str) -> bool:
+        """
+        Show search results for a query without typing it.
+        
+        Platforms that can open a spotify:search: URI directly override this.
+        
+        Returns:
+            True if the search page was opened, False if unsupported.
+        """
+        return False
     
     # =========================================================================
     # High-Level Methods - Shared across platforms
@@ -206,23 +528,34 @@ class SpotifyControllerBase(ABC):
     def open_search(self) -> None:
         """Open the quick search overlay."""
         self.bring_to_front()
-        self._keystroke("k", [self._get_command_modifier()])
-        time.sleep(self._ui_delay)
+        self._keystroke("k", [self._cmd_mod])
+        time.sleep(self.DEFAULT_OVERLAY_DELAY)
     
     def search(self, query: str, wait_for_results: bool = True) -> None:
         """
-        Open search and type a query.
+        Search for a query.
+        
+        Opens the search page via a spotify:search: URI when the platform
+        supports it, otherwise types the query into the quick search overlay.
         
         Args:
             query: The search query.
-            wait_for_results: If True, wait for results to load.
+            wait_for_results: If True, wait for the overlay to list results.
+                The search page opened from a URI is not the overlay, so
+                there is nothing to wait for on that path.
         """
+        if self._open_search_uri(query):
+            return
+        
+        self._type_search_query(query)
+        if wait_for_results:
+            self.wait_for(self._search_has_results, self.DEFAULT_SEARCH_DELAY)
+    
+    def _type_search_query(self, query: str) -> None:
+        """Open the quick search overlay and type a query into it."""
         self.open_search()
         time.sleep(0.3)
         self._type_text(query)
-        
-        if wait_for_results:
-            time.sleep(self.DEFAULT_SEARCH_DELAY)
     
     def play_playlist_by_name(
         self,
@@ -237,16 +570,17 @@ class SpotifyControllerBase(ABC):
 
         Args:
             playlist_name: The search query (use "playlist:name" for playlists only).
-            search_delay: Time to wait for search results to load.
+            search_delay: Maximum time to wait for search results to load.
         """
         if not self.is_running():
             self.launch()
         else:
             self.bring_to_front()
 
-        # Search for the playlist
-        self.search(playlist_name, wait_for_results=False)
-        time.sleep(search_delay)
+        # Search for the playlist in the quick search overlay, which is
+        # where Shift+Enter plays the highlighted result
+        self._type_search_query(playlist_name)
+        self.wait_for(self._search_has_results, search_delay)
 
         # Play the selected result (Shift+Enter) and show it (Enter)
         if hasattr(self, 'play_selected_search_result'):
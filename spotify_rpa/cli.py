@@ -1,8 +1,9 @@
 """Command-line interface for Spotify RPA."""
 
-import argparse
 import sys
 import time
+from types import SimpleNamespace
+from typing import Optional
 
 from .controller import SpotifyRPA, get_platform
 from .exceptions import AutomationError, PlatformNotSupportedError
@@ -10,19 +11,22 @@ from .exceptions import AutomationError, PlatformNotSupportedError
 
 def print_status(spotify: SpotifyRPA) -> None:
     """Print current playback status and track info."""
-    state = spotify.get_player_state()
-    print(f"Status: {state}")
+    snapshot = spotify.get_status_snapshot()
+    lines = [f"Status: {snapshot.state}"]
     
-    if state != "stopped":
-        track = spotify.get_current_track()
-        if track:
-            print(f"Track:  {track.name}")
-            print(f"Artist: {track.artist}")
-            print(f"Album:  {track.album}")
-            position = spotify.get_player_position()
-            duration = track.duration_seconds
-            print(f"Time:   {position:.0f}s / {duration:.0f}s")
-            print(f"URL:    {track.web_url}")
+    track = snapshot.track
+    if snapshot.state != "stopped" and track:
+        duration = track.duration_seconds
+        lines += [
+            f"Track:  {track.name}",
+            f"Artist: {track.artist}",
+            f"Album:  {track.album}",
+            f"Time:   {snapshot.position:.0f}s / {duration:.0f}s",
+            f"URL:    {track.web_url}",
+        ]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def verify_playback(spotify: SpotifyRPA, timeout: float = 5.0, initial_track: str = None) -> bool:
@@ -37,16 +41,17 @@ def verify_playback(spotify: SpotifyRPA, timeout: float = 5.0, initial_track: st
     Returns:
         True if playing (and track changed if initial_track provided).
     """
-    start = time.time()
-    while time.time() - start < timeout:
-        if spotify.is_playing():
-            if initial_track is None:
-                return True
-            # Check if track changed
-            track = spotify.get_current_track()
-            if track and track.name != initial_track:
-                return True
-        time.sleep(0.5)
+    if initial_track is None:
+        return spotify.wait_until_playing(timeout)
+
+    def track_changed() -> bool:
+        if not spotify.is_playing():
+            return False
+        track = spotify.get_current_track()
+        return track is not None and track.name != initial_track
+
+    if spotify.wait_for(track_changed, timeout):
+        return True
     # If still playing at the end, consider it success
     return spotify.is_playing()
 
@@ -184,8 +189,10 @@ def cmd_volume(args, spotify: SpotifyRPA) -> int:
 # Main Entry Point
 # =============================================================================
 
-def main() -> int:
-    """Main entry point for the CLI."""
+def _build_parser():
+    """Build the full argparse parser (used for help and error reporting)."""
+    import argparse
+    
     # Global arguments (must appear before the subcommand)
     parent_parser = argparse.ArgumentParser(add_help=False)
     parent_parser.add_argument(
@@ -193,6 +200,11 @@ def main() -> int:
         action="store_true",
         help="Enable debug output"
     )
+    parent_parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Check whether Spotify is running only once per command"
+    )
     
     parser = argparse.ArgumentParser(
         prog="spotify",
@@ -249,11 +261,71 @@ def main() -> int:
     )
     p_volume.set_defaults(func=cmd_volume)
     
-    args = parser.parse_args()
+    return parser
+
+
+# Handler and positional argument name for each command
+COMMANDS = {
+    "play-playlist": (cmd_play_playlist, "name"),
+    "search": (cmd_search, "query"),
+    "play": (cmd_play, None),
+    "pause": (cmd_pause, None),
+    "next": (cmd_next, None),
+    "prev": (cmd_prev, None),
+    "status": (cmd_status, None),
+    "volume": (cmd_volume, "level"),
+}
+
+
+def _parse_args_fast(argv: list) -> Optional[SimpleNamespace]:
+    """
+    Parse well-formed command lines without building the argparse parser.
+    
+    Returns:
+        The parsed arguments, or None if the command line needs the full
+        parser (help, unknown commands, options or invalid arguments).
+    """
+    flags = {"debug": False, "fast": False}
+    index = 0
+    while index < len(argv) and argv[index] in ("--debug", "-d", "--fast"):
+        flags["fast" if argv[index] == "--fast" else "debug"] = True
+        index += 1
     
-    if not args.command:
-        parser.print_help()
-        return 0
+    if index >= len(argv) or argv[index] not in COMMANDS:
+        return None
+    command = argv[index]
+    rest = argv[index + 1:]
+    if any(arg.startswith("-") for arg in rest):
+        return None
+    
+    func, arg_name = COMMANDS[command]
+    args = SimpleNamespace(**flags, command=command, func=func)
+    if command == "volume":
+        if len(rest) > 1:
+            return None
+        try:
+            args.level = int(rest[0]) if rest else None
+        except ValueError:
+            return None
+    elif arg_name:
+        if len(rest) != 1:
+            return None
+        setattr(args, arg_name, rest[0])
+    elif rest:
+        return None
+    return args
+
+
+def main() -> int:
+    """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+    args = _parse_args_fast(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return 0
     
     # Detect platform and show info
     current_platform = get_platform()
@@ -266,6 +338,8 @@ def main() -> int:
     except PlatformNotSupportedError as e:
         print(f"Error: {e}")
         return 1
+    if args.fast:
+        spotify.set_is_running_ttl(float("inf"))
     
     # Execute the command
     try:
@@ -276,6 +350,8 @@ def main() -> int:
     except KeyboardInterrupt:
         print("\nInterrupted.")
         return 130
+    finally:
+        spotify.close()
 
 
 if __name__ == "__main__":
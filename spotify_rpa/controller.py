@@ -1,15 +1,21 @@
 """Factory and facade for Spotify controllers."""
 
+import functools
 import platform
+import time
+from typing import Optional
 
 from .base import SpotifyControllerBase
 from .exceptions import PlatformNotSupportedError
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform() -> str:
     """
     Detect the current operating system.
     
+    The result is cached since the platform cannot change within a process.
+    
     Returns:
         One of: "macos", "windows", "linux"
     """
@@ -66,6 +72,9 @@ class SpotifyRPA:
         >>> spotify.play_playlist_by_name("My Playlist")
     """
     
+    # How long an is_running() result is reused (in seconds)
+    IS_RUNNING_TTL = 2.0
+    
     def __init__(self, debug: bool = False):
         """
         Initialize the SpotifyRPA controller.
@@ -76,7 +85,64 @@ class SpotifyRPA:
         self.platform = get_platform()
         self.debug = debug
         self._controller = create_spotify_controller(self.platform, debug=debug)
+        self._bind_controller_methods()
+        self._is_running_ttl = self.IS_RUNNING_TTL
+        self._is_running_checked_at: Optional[float] = None
+        self._is_running_value = False
+    
+    def _bind_controller_methods(self) -> None:
+        """
+        Copy the controller's public methods onto this instance.
+        
+        Calls then resolve through the instance dict instead of falling
+        through to __getattr__. Methods defined on SpotifyRPA itself keep
+        precedence over the controller's.
+        """
+        cls = type(self)
+        for name in dir(self._controller):
+            if name.startswith("_") or hasattr(cls, name):
+                continue
+            attr = getattr(self._controller, name)
+            if callable(attr):
+                self.__dict__[name] = attr
+    
+    def set_is_running_ttl(self, ttl: float) -> None:
+        """
+        Set how long an is_running() result is reused.
+        
+        Args:
+            ttl: Seconds to trust the last result; float("inf") checks only once.
+        """
+        self._is_running_ttl = ttl
+    
+    def is_running(self) -> bool:
+        """Check if Spotify is running, reusing a recent result."""
+        now = time.monotonic()
+        checked_at = self._is_running_checked_at
+        if checked_at is None or now - checked_at >= self._is_running_ttl:
+            self._is_running_value = self._controller.is_running()
+            self._is_running_checked_at = now
+        return self._is_running_value
+    
+    def launch(self, *args, **kwargs) -> None:
+        """Launch Spotify and forget the cached is_running() result."""
+        self._is_running_checked_at = None
+        self._controller.launch(*args, **kwargs)
+    
+    def quit(self) -> None:
+        """Quit Spotify and forget the cached is_running() result."""
+        self._is_running_checked_at = None
+        self._controller.quit()
+    
+    def close(self) -> None:
+        """Release resources held by the platform-specific controller."""
+        controller = self.__dict__.get("_controller")
+        if controller is not None:
+            controller.close()
+    
+    def __del__(self):
+        self.close()
     
     def __getattr__(self, name):
-        """Delegate all method calls to the platform-specific controller."""
+        """Delegate anything not bound at construction to the controller."""
         return getattr(self._controller, name)
@@ -1,13 +1,655 @@
 """macOS-specific Spotify controller using AppleScript and System Events."""
 
+import contextlib
+import functools
+import hashlib
+import math
+import os
+import select
 import subprocess
+import textwrap
+import threading
 import time
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
 
-from .base import SpotifyControllerBase
-from .models import TrackInfo
+from .base import KeyPress, SpotifyControllerBase
+from .models import StatusSnapshot, TrackInfo
 from .exceptions import AppleScriptError
 
+__all__ = ["MacOSSpotifyController"]
+
+
+# Markers framing each response written by the osascript coprocess
+_RESPONSE_START = "<<SPOTIFY_RPA:"
+_RESPONSE_END = "<<END>>"
+
+# Seconds to wait for the coprocess to answer before giving up on it.
+# Scripts that wait inside AppleScript extend this by their own timeout.
+_RESPONSE_TIMEOUT = 30.0
+
+# Seconds a new coprocess has to answer its handshake. No script has been
+# sent at that point, so one that does not answer is safe to fall back from.
+_HANDSHAKE_TIMEOUT = 3.0
+
+# Frames a script's status and result for reading back from the coprocess.
+# The interactive interpreter echoes results in source form, quoting and
+# escaping strings, so the result is sent as comma-separated character ids:
+# digits and commas read the same whether or not they were quoted.
+_FRAME_RESPONSE = f'''set rpaPayload to ""
+if rpaResult is not "" then
+    set rpaCodes to id of rpaResult
+    if class of rpaCodes is not list then set rpaCodes to {{rpaCodes}}
+    set AppleScript's text item delimiters to ","
+    set rpaPayload to rpaCodes as text
+    set AppleScript's text item delimiters to ""
+end if
+return "{_RESPONSE_START}" & rpaStatus & ">>" & rpaPayload & "{_RESPONSE_END}"
+'''
+
+# Runs a script inside the coprocess and reports its result or error in-band.
+# Error -2763 means the script ran fine but returned no result (e.g. "play").
+_COPROCESS_WRAPPER = '''
+try
+    set rpaResult to (run script "{script}") as text
+    set rpaStatus to "OK"
+on error errMsg number errNum
+    if errNum is -2763 then
+        set rpaResult to ""
+        set rpaStatus to "OK"
+    else
+        set rpaResult to errMsg
+        set rpaStatus to "ERR"
+    end if
+end try
+''' + _FRAME_RESPONSE
+
+
+# Separator between fields in track records returned by AppleScript. The
+# ASCII unit separator never appears in track metadata, and splitting on a
+# single character is cheaper than on a multi-character delimiter.
+_FIELD_SEPARATOR = "\x1f"
+
+# Whitespace trimmed from script output. str.strip() would also remove the
+# field and record separators, which are control characters.
+_OUTPUT_WHITESPACE = " \t\r\n"
+
+# Number of fields in a track record
+_TRACK_FIELD_COUNT = 5
+
+# AppleScript expression returning every TrackInfo field of the current track
+# as one record, so a track is always fetched in a single round trip
+_TRACK_RECORD = (
+    'name of current track & {sep} & artist of current track & {sep} & '
+    'album of current track & {sep} & duration of current track & {sep} & '
+    'spotify url of current track'
+).format(sep="(character id 31)")
+
+# Separator between the results of scripts run in one batch
+_RESULT_SEPARATOR = "\x1e"
+
+# Runs several scripts in order and joins their results, stopping at the
+# first error. Error -2763 means a script returned no result (e.g. "play").
+_BATCH_SCRIPT = '''
+set rpaResults to ""
+repeat with rpaScript in {{{scripts}}}
+    try
+        set rpaResult to (run script (contents of rpaScript)) as text
+    on error errMsg number errNum
+        if errNum is not -2763 then error errMsg number errNum
+        set rpaResult to ""
+    end try
+    set rpaResults to rpaResults & rpaResult & (character id 30)
+end repeat
+return rpaResults
+'''
+
+# Fixed scripts that are compiled once with osacompile and cached on disk.
+# Scripts taking arguments receive them as strings through "on run argv".
+_COMPILED_SCRIPTS = {
+    "is_running": '''
+tell application "System Events"
+    return (name of processes) contains "Spotify"
+end tell
+''',
+    "player_state": 'tell application "Spotify" to player state as string',
+    "player_position": 'tell application "Spotify" to player position',
+    "volume": 'tell application "Spotify" to sound volume',
+    "shuffling": 'tell application "Spotify" to shuffling',
+    "repeating": 'tell application "Spotify" to repeating',
+    "current_track": f'''
+tell application "Spotify"
+    if player state is stopped then
+        return "STOPPED"
+    end if
+    return {_TRACK_RECORD}
+end tell
+''',
+    "set_volume": '''
+on run argv
+    tell application "Spotify" to set sound volume to (item 1 of argv) as integer
+end run
+''',
+    "next_track": 'tell application "Spotify" to next track',
+    "previous_track": 'tell application "Spotify" to previous track',
+    "play_pause": 'tell application "Spotify" to playpause',
+    "play": 'tell application "Spotify" to play',
+    "pause": 'tell application "Spotify" to pause',
+    "status_snapshot": f'''
+tell application "Spotify"
+    set playerState to player state as string
+    if player state is stopped then
+        return playerState
+    end if
+    return playerState & (character id 31) & player position & (character id 31) & {_TRACK_RECORD}
+end tell
+''',
+}
+
+
+# Compiled once like the scripts above and loaded into the coprocess once per
+# process. It keeps every compiled script it has loaded in a property, so
+# running one costs a single handler call instead of compiling a wrapper and
+# reading the script from disk. Responses are framed by _FRAME_RESPONSE.
+_INVOKER_SCRIPT = f'''
+property loadedPaths : {{}}
+property loadedScripts : {{}}
+
+on invoke(scriptPath, scriptArgs)
+    try
+        set rpaScript to missing value
+        repeat with i from 1 to count of loadedPaths
+            if item i of loadedPaths is scriptPath then set rpaScript to item i of loadedScripts
+        end repeat
+        if rpaScript is missing value then
+            set rpaScript to load script (POSIX file scriptPath)
+            set end of loadedPaths to scriptPath
+            set end of loadedScripts to rpaScript
+        end if
+        set rpaResult to (run script rpaScript with parameters scriptArgs) as text
+        set rpaStatus to "OK"
+    on error errMsg number errNum
+        if errNum is -2763 then
+            set rpaResult to ""
+            set rpaStatus to "OK"
+        else
+            set rpaResult to errMsg
+            set rpaStatus to "ERR"
+        end if
+    end try
+{textwrap.indent(_FRAME_RESPONSE, "    ")}end invoke
+'''
+_COMPILED_SCRIPTS["invoker"] = _INVOKER_SCRIPT
+
+
+def _parse_track(fields: list) -> Optional[TrackInfo]:
+    """Build a TrackInfo from the fields of a track record."""
+    if len(fields) != _TRACK_FIELD_COUNT:
+        return None
+    return TrackInfo(
+        name=fields[0],
+        artist=fields[1],
+        album=fields[2],
+        duration_ms=int(fields[3]),
+        spotify_url=fields[4]
+    )
+
+
+def _cached_read(method):
+    """
+    Cache a read-only query for CACHE_TTL seconds.
+    
+    Bursts of getters (e.g. state followed by track) then share one
+    AppleScript round trip. Methods decorated with _clears_cache drop the
+    cached values so reads after a change are fresh, and a read that
+    overlapped such a command is not cached at all.
+    """
+    key = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        generation = self._cache_generation
+        value = method(self)
+        self._fill_cache(generation, now, {key: value})
+        return value
+    
+    return wrapper
+
+
+def _clears_cache(method):
+    """
+    Drop values cached by _cached_read around running a command.
+    
+    The cache generation is bumped both before and after the command, so
+    reads that were in flight on another thread meanwhile (e.g. a watcher
+    poll) cannot store what they saw before the command took effect.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate_cache()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_cache()
+    
+    return wrapper
+
+
+def _script_cache_dir() -> str:
+    """Directory where compiled scripts are cached."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "spotify_rpa")
+
+
+def _compile_script(name: str) -> Optional[str]:
+    """
+    Compile a script from _COMPILED_SCRIPTS into the cache directory.
+    
+    The file name includes a hash of the source, so edited scripts are
+    recompiled automatically.
+    
+    Returns:
+        Path to the compiled .scpt file, or None if compilation failed.
+    """
+    source = _COMPILED_SCRIPTS[name]
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    path = os.path.join(_script_cache_dir(), f"{name}-{digest}.scpt")
+    if os.path.exists(path):
+        return path
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        result = subprocess.run(
+            ["osacompile", "-o", tmp_path, "-e", source],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return None
+        os.replace(tmp_path, path)
+    except OSError:
+        return None
+    return path
+
+
+def _using_clause(modifiers: Optional[list]) -> str:
+    """Build the ' using {...}' suffix for a keystroke or key code."""
+    if not modifiers:
+        return ""
+    modifier_str = ", ".join(f"{m} down" for m in modifiers)
+    return f" using {{{modifier_str}}}"
+
+
+# Escapes for characters that cannot appear verbatim in an AppleScript
+# string literal, applied in a single str.translate pass
+_APPLESCRIPT_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+
+def _quote_applescript(text: str) -> str:
+    """Escape text for use inside an AppleScript string literal."""
+    return text.translate(_APPLESCRIPT_ESCAPES)
+
+
+# Accessibility path to the result list of the quick search overlay (Cmd+K),
+# addressed directly so that no query walks the whole window. If a Spotify
+# update moves the overlay, no results are found and waits on them simply
+# run for their full timeout.
+_QUICK_SEARCH_RESULTS = (
+    'list 1 of (first group of group 1 of group 1 of front window '
+    'whose subrole is "AXApplicationDialog")'
+)
+
+
+# Spotify's bundle identifier, used to address it through ScriptingBridge
+_SPOTIFY_BUNDLE_ID = "com.spotify.client"
+
+
+def _four_char_code(code: str) -> int:
+    """Convert an Apple Event four-character code to its integer value."""
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+# ScriptingBridge reports "player state" as the enum's four-character code
+_BRIDGE_PLAYER_STATES = {
+    _four_char_code("kPSP"): "playing",
+    _four_char_code("kPSp"): "paused",
+    _four_char_code("kPSS"): "stopped",
+}
+
+
+def _load_scripting_bridge() -> Optional[Any]:
+    """
+    Get Spotify's ScriptingBridge application object.
+    
+    ScriptingBridge sends Apple Events from this process, which avoids
+    running an AppleScript per command. It needs the optional
+    pyobjc-framework-ScriptingBridge package.
+    
+    Returns:
+        The SBApplication for Spotify, or None if PyObjC is not installed.
+    """
+    try:
+        from ScriptingBridge import SBApplication
+    except ImportError:
+        return None
+    return SBApplication.applicationWithBundleIdentifier_(_SPOTIFY_BUNDLE_ID)
+
+
+# Marks a controller whose ScriptingBridge has not been looked up yet
+_BRIDGE_NOT_LOADED = object()
+
+
+@contextlib.contextmanager
+def _bridge_errors():
+    """
+    Report failed ScriptingBridge calls as AppleScriptError.
+    
+    A failed Apple Event or a nil result (e.g. no current track) surfaces as
+    an arbitrary Python exception, while callers expect the same error the
+    AppleScript path raises.
+    """
+    try:
+        yield
+    except Exception as e:
+        raise AppleScriptError(f"ScriptingBridge call failed: {e!r}") from e
+
+
+class _CoprocessUnavailable(Exception):
+    """Raised when a script could not be handed to the osascript coprocess."""
+
+
+class _CoprocessFailed(AppleScriptError):
+    """Raised when the coprocess took a script but gave no usable response."""
+
+
+def _wait_readable(stream, timeout: float) -> bool:
+    """Wait until a pipe has data to read; False if the timeout expired."""
+    readable, _, _ = select.select([stream], [], [], timeout)
+    return bool(readable)
+
+
+class _OsascriptSession:
+    """
+    A long-lived ``osascript -i`` coprocess.
+
+    Spawning osascript and loading the AppleScript components dominates the
+    cost of a single command, so one interactive interpreter is kept alive
+    and scripts are written to its stdin one line at a time. The process is
+    started by prewarm() or lazily on first use. If it cannot be started or
+    does not accept the script, the script runs in a one-off ``osascript -e``
+    process instead while a replacement coprocess starts up for the next call.
+    Each new coprocess must first answer a handshake within _HANDSHAKE_TIMEOUT,
+    so one that starts but never responds, or whose output cannot be parsed,
+    is caught before any script is sent. Once a script has been sent it is
+    never run again: if the coprocess dies, stops answering or sends a
+    malformed response, the script may already have taken effect, so
+    AppleScriptError is raised instead. After MAX_FAILURES consecutive
+    failures of either kind, osascript -i is assumed to be unusable and
+    every later script runs in a one-off process.
+
+    Compiled scripts run through an invoker script that is loaded into each
+    coprocess once and keeps the scripts it has loaded, see run_compiled().
+    """
+
+    __slots__ = (
+        "_process",
+        "_buffer",
+        "_lock",
+        "_failures",
+        "_handshake_pending",
+        "_invoker_process",
+        "_invoker_loaded",
+    )
+
+    # Consecutive coprocess failures after which it is no longer used
+    MAX_FAILURES = 2
+
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._buffer = bytearray()
+        self._failures = 0
+        # Whether the current process still owes its handshake response
+        self._handshake_pending = False
+        # Whether the invoker could be loaded, and into which process
+        self._invoker_process: Optional[subprocess.Popen] = None
+        self._invoker_loaded = False
+        # The pipes are shared, so only one script may be in flight
+        self._lock = threading.RLock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            try:
+                self._process = subprocess.Popen(
+                    ["osascript", "-i"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0,
+                )
+            except OSError as e:
+                raise _CoprocessUnavailable(f"Could not start osascript: {e}") from e
+            self._buffer.clear()
+            # Answered once the interpreter is up; read before the first script
+            self._handshake_pending = True
+            self._write(f'"{_RESPONSE_START}OK>>{_RESPONSE_END}"\n')
+        return self._process
+
+    def _write(self, line: str) -> None:
+        """Write a line to the coprocess."""
+        try:
+            self._process.stdin.write(line.encode("utf-8"))
+        except OSError as e:
+            self.close()
+            raise _CoprocessUnavailable(f"osascript coprocess is not available: {e}") from e
+
+    def prewarm(self) -> None:
+        """
+        Start the coprocess ahead of the first script.
+        
+        Popen returns as soon as the child is forked, so the interpreter
+        loads and answers its handshake in parallel with whatever the caller
+        does next. Failures count toward MAX_FAILURES but are not raised;
+        run() falls back to one-off processes anyway.
+        """
+        with self._lock:
+            try:
+                self._ensure_process()
+            except _CoprocessUnavailable:
+                self._failures += 1
+
+    def run(self, script: str, timeout: float = _RESPONSE_TIMEOUT) -> str:
+        """Run a script and return its result as text."""
+        return self._run(lambda: self._wrapper_line(script), script, timeout)
+
+    def run_compiled(
+        self,
+        invoker_path: str,
+        script_path: str,
+        args: Sequence[str],
+        source: str,
+        timeout: float = _RESPONSE_TIMEOUT
+    ) -> str:
+        """
+        Run a compiled script and return its result as text.
+        
+        The call is a one-line handler call on the invoker loaded in the
+        coprocess. If the invoker cannot be loaded, source is run instead,
+        the same way run() would.
+        
+        Args:
+            invoker_path: Compiled _INVOKER_SCRIPT.
+            script_path: Compiled script to run.
+            args: Strings passed to the script's run handler.
+            source: Equivalent script text used as the fallback.
+            timeout: Seconds to wait for the result.
+        """
+        def line() -> str:
+            if not self._load_invoker(invoker_path):
+                return self._wrapper_line(source)
+            params = ", ".join(f'"{_quote_applescript(arg)}"' for arg in args)
+            return f'rpaInvoker\'s invoke("{_quote_applescript(script_path)}", {{{params}}})\n'
+        
+        return self._run(line, source, timeout)
+
+    def _run(self, make_line: Callable[[], str], script: str, timeout: float) -> str:
+        """Send the line built by make_line, or run script once if that fails."""
+        with self._lock:
+            if self._failures >= self.MAX_FAILURES:
+                return self._run_once(script)
+            try:
+                status, output = self._send(make_line(), timeout)
+            except _CoprocessUnavailable:
+                self._failures += 1
+                if self._failures < self.MAX_FAILURES:
+                    # Let a replacement warm up while the one-off run executes
+                    self.prewarm()
+                return self._run_once(script)
+            except _CoprocessFailed:
+                self._failures += 1
+                raise
+            self._failures = 0
+        if status != "OK":
+            raise AppleScriptError(f"AppleScript failed: {output}")
+        return output
+
+    @staticmethod
+    def _wrapper_line(script: str) -> str:
+        """Build the line that runs a script inside _COPROCESS_WRAPPER."""
+        wrapper = _COPROCESS_WRAPPER.replace("{script}", _quote_applescript(script))
+        return f'run script "{_quote_applescript(wrapper)}"\n'
+
+    def _load_invoker(self, invoker_path: str) -> bool:
+        """
+        Load the invoker into the coprocess unless it already holds it.
+        
+        rpaInvoker is a global of the interactive session, so it lives as
+        long as the process does. The final line reports whether loading
+        worked as the status of an empty response; a failed load is not retried for the same process.
+        
+        Raises:
+            _CoprocessUnavailable: If the coprocess is not usable. Nothing
+                but the invoker has been sent at that point.
+        """
+        process = self._ensure_process()
+        if self._invoker_process is not process:
+            lines = (
+                "set rpaInvoker to missing value\n"
+                f'set rpaInvoker to load script (POSIX file "{_quote_applescript(invoker_path)}")\n'
+                f'"{_RESPONSE_START}" & (rpaInvoker is not missing value) & ">>{_RESPONSE_END}"\n'
+            )
+            try:
+                loaded, _ = self._send(lines, _RESPONSE_TIMEOUT)
+            except AppleScriptError as e:
+                raise _CoprocessUnavailable(f"Could not load the invoker: {e}") from e
+            self._invoker_process = process
+            self._invoker_loaded = loaded == "true"
+        return self._invoker_loaded
+
+    def _send(self, line: str, timeout: float) -> tuple:
+        """
+        Write a line to the coprocess and read back the framed response.
+        
+        Raises:
+            _CoprocessUnavailable: If the coprocess could not be started,
+                did not answer its handshake or did not accept the line.
+            _CoprocessFailed: If the line was sent but no usable response
+                came back.
+        """
+        process = self._ensure_process()
+        if self._handshake_pending:
+            try:
+                self._read_response(process, _HANDSHAKE_TIMEOUT)
+            except _CoprocessFailed as e:
+                raise _CoprocessUnavailable(f"osascript coprocess did not start: {e}") from e
+            self._handshake_pending = False
+        self._write(line)
+        return self._read_response(process, timeout)
+
+    @staticmethod
+    def _run_once(script: str) -> str:
+        """Run a script in a new osascript process."""
+        try:
+            result = subprocess.run(
+                ["osascript", "-e", script],
+                capture_output=True,
+                text=True
+            )
+        except OSError as e:
+            raise AppleScriptError(f"Could not start osascript: {e}") from e
+        
+        if result.returncode != 0:
+            raise AppleScriptError(f"AppleScript failed: {result.stderr}")
+        
+        return result.stdout.rstrip("\n")
+
+    def _read_response(self, process: subprocess.Popen, timeout: float) -> tuple:
+        """
+        Read stdout until a complete framed response has arrived.
+        
+        Raises:
+            _CoprocessFailed: If the coprocess exits, does not respond
+                within timeout seconds or sends a malformed response. It is
+                shut down in each case.
+        """
+        end_marker = _RESPONSE_END.encode("utf-8")
+        buffer = self._buffer
+        deadline = time.monotonic() + timeout
+        end = buffer.find(end_marker)
+        while end == -1:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not _wait_readable(process.stdout, remaining):
+                self.close()
+                raise _CoprocessFailed(f"osascript did not respond within {timeout:g}s")
+            chunk = process.stdout.read(4096)
+            if not chunk:
+                self.close()
+                raise _CoprocessFailed("osascript coprocess exited before responding")
+            buffer += chunk
+            end = buffer.find(end_marker)
+
+        text = buffer[:end].decode("utf-8", errors="replace")
+        del buffer[:end + len(end_marker)]
+        start = text.rfind(_RESPONSE_START)
+        if start != -1:
+            status, _, payload = text[start + len(_RESPONSE_START):].partition(">>")
+            try:
+                return status, "".join(chr(int(code)) for code in payload.split(",")) if payload else ""
+            except ValueError:
+                pass
+        # The output is out of step with the scripts sent; start over
+        self.close()
+        raise _CoprocessFailed(f"Malformed osascript response: {text!r}")
+
+    def close(self) -> None:
+        """Terminate the coprocess if it is running."""
+        with self._lock:
+            process, self._process = self._process, None
+            self._buffer.clear()
+            self._handshake_pending = False
+            self._invoker_process = None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.terminate()
+            process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
 
 class MacOSSpotifyController(SpotifyControllerBase):
     """
@@ -16,127 +658,310 @@ class MacOSSpotifyController(SpotifyControllerBase):
     This implementation uses:
     - Native Spotify AppleScript commands for playback control
     - System Events for UI automation (keyboard input, navigation)
+
+    All scripts run in a single persistent osascript process instead of
+    spawning a new interpreter per command. When PyObjC's ScriptingBridge
+    is installed, playback commands and queries skip AppleScript and send
+    Apple Events to Spotify directly. PyObjC is imported on first use rather
+    than when the controller is created.
     """
+
+    __slots__ = (
+        "_session",
+        "_bridge",
+        "_bridge_lock",
+        "_compiled_paths",
+        "_cache",
+        "_cache_lock",
+        "_cache_generation",
+    )
+
+    # Text at least this long is pasted instead of typed key by key
+    PASTE_MIN_LENGTH = 4
+    
+    # Longest single script wait_until_playing() runs (in seconds)
+    WAIT_SLICE = 1.0
+    
+    # How long results of read-only queries are reused (in seconds)
+    CACHE_TTL = 0.25
     
-    def _run_applescript(self, script: str) -> str:
+    # Start the osascript coprocess when the controller is created
+    PREWARM_COPROCESS = True
+
+    def __init__(self, debug: bool = False):
+        super().__init__(debug)
+        self._session = _OsascriptSession()
+        if self.PREWARM_COPROCESS:
+            self._session.prewarm()
+        self._bridge = _BRIDGE_NOT_LOADED
+        # The watcher thread shares the bridge object with its caller
+        self._bridge_lock = threading.RLock()
+        self._compiled_paths = {}
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped by _clears_cache; results of older reads are not cached
+        self._cache_generation = 0
+    
+    def _scripting_bridge(self) -> Optional[Any]:
+        """Spotify's ScriptingBridge object, or None if PyObjC is not installed."""
+        with self._bridge_lock:
+            if self._bridge is _BRIDGE_NOT_LOADED:
+                self._bridge = _load_scripting_bridge()
+            return self._bridge
+    
+    def _invalidate_cache(self) -> None:
+        """Drop cached reads and any read still in flight."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.clear()
+    
+    def _fill_cache(self, generation: int, now: float, values: Dict[str, Any]) -> None:
+        """Cache read results unless a command has run since the read began."""
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            for key, value in values.items():
+                self._cache[key] = (now, value)
+    
+    def _run_applescript(self, script: str, timeout: float = _RESPONSE_TIMEOUT) -> str:
         """Execute an AppleScript and return the output."""
-        if self.debug:
-            print(f"[AppleScript] {script[:100]}...")
+        self._log("[AppleScript] %.100s...", script)
+        return self._session.run(script, timeout).strip(_OUTPUT_WHITESPACE)
+    
+    def _run_applescript_many(self, scripts: Sequence[str]) -> List[str]:
+        """Execute several AppleScripts in one round trip and return their outputs."""
+        if not scripts:
+            return []
+        quoted = ", ".join(f'"{_quote_applescript(script)}"' for script in scripts)
+        batch_script = _BATCH_SCRIPT.format(scripts=quoted)
+        self._log("[AppleScript] batch of %d: %.100s...", len(scripts), batch_script)
+        result = self._session.run(batch_script)
+        outputs = result.split(_RESULT_SEPARATOR)[:len(scripts)]
+        return [output.strip(_OUTPUT_WHITESPACE) for output in outputs]
+    
+    @_clears_cache
+    def batch(self, *scripts: str) -> List[str]:
+        """
+        Run several AppleScripts in a single round trip.
         
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True
-        )
+        Example:
+            >>> controller.batch(
+            ...     'tell application "Spotify" to play',
+            ...     'tell application "Spotify" to player state as string',
+            ... )
+            ['', 'playing']
         
-        if result.returncode != 0:
-            raise AppleScriptError(f"AppleScript failed: {result.stderr}")
+        Returns:
+            The output of each script, in order.
+        
+        Raises:
+            AppleScriptError: If any script fails; later scripts are not run.
+        """
+        return self._run_applescript_many(scripts)
+    
+    def _run_compiled(self, name: str, *args: str) -> str:
+        """
+        Run one of the precompiled scripts with the given arguments.
+        
+        The coprocess keeps compiled scripts loaded between calls. Without
+        osacompile the script source is run instead.
+        """
+        script = self._compiled_invocation(name, *args)
+        path = self._compiled_path(name)
+        invoker_path = self._compiled_path("invoker")
+        if path is None or invoker_path is None:
+            return self._run_applescript(script)
+        self._log("[AppleScript] compiled %s %s", name, args)
+        result = self._session.run_compiled(invoker_path, path, args, script)
+        return result.strip(_OUTPUT_WHITESPACE)
+    
+    def _compiled_path(self, name: str) -> Optional[str]:
+        """Path of a compiled script, compiling it on first use."""
+        if name not in self._compiled_paths:
+            self._compiled_paths[name] = _compile_script(name)
+        return self._compiled_paths[name]
+    
+    def _compiled_invocation(self, name: str, *args: str) -> str:
+        """
+        Build a script that runs one of the precompiled scripts.
         
-        return result.stdout.strip()
+        Falls back to running the script source if it could not be compiled.
+        """
+        path = self._compiled_path(name)
+        
+        if path is not None:
+            target = f'(POSIX file "{_quote_applescript(path)}")'
+        else:
+            target = f'"{_quote_applescript(_COMPILED_SCRIPTS[name])}"'
+        script = f"run script {target}"
+        if args:
+            params = ", ".join(f'"{_quote_applescript(arg)}"' for arg in args)
+            script += f" with parameters {{{params}}}"
+        return script
+
+    def close(self) -> None:
+        """Stop the watcher and terminate the osascript coprocess."""
+        super().close()
+        self._session.close()
     
     # =========================================================================
     # Key Codes (macOS-specific)
     # =========================================================================
     
+    RETURN_KEY_CODE = 36
+    ESCAPE_KEY_CODE = 53
+    TAB_KEY_CODE = 48
+    DOWN_ARROW_KEY_CODE = 125
+    UP_ARROW_KEY_CODE = 126
+    SPACE_KEY_CODE = 49
+    COMMAND_MODIFIER = "command"
+    
     def _get_return_key_code(self) -> int:
-        return 36
+        return self.RETURN_KEY_CODE
     
     def _get_escape_key_code(self) -> int:
-        return 53
+        return self.ESCAPE_KEY_CODE
     
     def _get_tab_key_code(self) -> int:
-        return 48
+        return self.TAB_KEY_CODE
     
     def _get_down_arrow_key_code(self) -> int:
-        return 125
+        return self.DOWN_ARROW_KEY_CODE
     
     def _get_up_arrow_key_code(self) -> int:
-        return 126
+        return self.UP_ARROW_KEY_CODE
     
     def _get_space_key_code(self) -> int:
-        return 49
+        return self.SPACE_KEY_CODE
     
     def _get_command_modifier(self) -> str:
-        return "command"
+        return self.COMMAND_MODIFIER
     
     # =========================================================================
     # Application Control
     # =========================================================================
     
+    @_clears_cache
     def launch(self, wait: bool = True, delay: Optional[float] = None) -> None:
         """Launch the Spotify application."""
         self._run_applescript('tell application "Spotify" to activate')
         if wait:
             time.sleep(delay or self.DEFAULT_LAUNCH_DELAY)
     
+    @_clears_cache
     def quit(self) -> None:
         """Quit the Spotify application."""
         self._run_applescript('tell application "Spotify" to quit')
     
     def is_running(self) -> bool:
         """Check if Spotify is currently running."""
-        script = '''
-        tell application "System Events"
-            return (name of processes) contains "Spotify"
-        end tell
-        '''
-        result = self._run_applescript(script)
+        result = self._run_compiled("is_running")
         return result.lower() == "true"
     
     def bring_to_front(self) -> None:
-        """Bring the Spotify window to the front."""
-        self._run_applescript('tell application "Spotify" to activate')
-        time.sleep(self._ui_delay)
+        """Bring the Spotify window to the front, waiting inside the script."""
+        self._run_applescript(f'tell application "Spotify" to activate\ndelay {self._ui_delay}')
     
     # =========================================================================
     # Playback Controls
     # =========================================================================
     
+    @_clears_cache
     def play(self) -> None:
         """Start or resume playback."""
-        self._run_applescript('tell application "Spotify" to play')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.play()
+            return
+        self._run_compiled("play")
     
+    @_clears_cache
     def pause(self) -> None:
         """Pause playback."""
-        self._run_applescript('tell application "Spotify" to pause')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.pause()
+            return
+        self._run_compiled("pause")
     
+    @_clears_cache
     def play_pause(self) -> None:
         """Toggle between play and pause."""
-        self._run_applescript('tell application "Spotify" to playpause')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.playpause()
+            return
+        self._run_compiled("play_pause")
     
+    @_clears_cache
     def next_track(self) -> None:
         """Skip to the next track."""
-        self._run_applescript('tell application "Spotify" to next track')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.nextTrack()
+            return
+        self._run_compiled("next_track")
     
+    @_clears_cache
     def previous_track(self) -> None:
         """Go back to the previous track."""
-        self._run_applescript('tell application "Spotify" to previous track')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.previousTrack()
+            return
+        self._run_compiled("previous_track")
     
+    @_clears_cache
     def set_volume(self, level: int) -> None:
         """Set the Spotify volume (0-100)."""
         if not 0 <= level <= 100:
             raise ValueError("Volume must be between 0 and 100")
-        self._run_applescript(f'tell application "Spotify" to set sound volume to {level}')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                bridge.setSoundVolume_(level)
+            return
+        self._run_compiled("set_volume", str(level))
     
+    @_cached_read
     def get_volume(self) -> int:
         """Get the current Spotify volume."""
-        result = self._run_applescript('tell application "Spotify" to sound volume')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                return int(bridge.soundVolume())
+        result = self._run_compiled("volume")
         return int(result)
     
     # =========================================================================
     # Playback State
     # =========================================================================
     
+    @_cached_read
     def get_player_state(self) -> str:
         """Get the current player state (playing, paused, stopped)."""
-        result = self._run_applescript('tell application "Spotify" to player state as string')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                return _BRIDGE_PLAYER_STATES.get(bridge.playerState(), "stopped")
+        result = self._run_compiled("player_state")
         return result.lower()
     
     def get_player_position(self) -> float:
         """Get the current playback position in seconds."""
-        result = self._run_applescript('tell application "Spotify" to player position')
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            with self._bridge_lock, _bridge_errors():
+                return float(bridge.playerPosition())
+        result = self._run_compiled("player_position")
         return float(result)
     
+    @_clears_cache
     def set_player_position(self, position: float) -> None:
         """Set the playback position."""
         self._run_applescript(f'tell application "Spotify" to set player position to {position}')
@@ -145,77 +970,149 @@ class MacOSSpotifyController(SpotifyControllerBase):
     # Track Information
     # =========================================================================
     
+    @_cached_read
     def get_current_track(self) -> Optional[TrackInfo]:
         """Get information about the currently playing track."""
-        script = '''
-        tell application "Spotify"
-            if player state is stopped then
-                return "STOPPED"
-            end if
-            set trackName to name of current track
-            set trackArtist to artist of current track
-            set trackAlbum to album of current track
-            set trackDuration to duration of current track
-            set trackURL to spotify url of current track
-            return trackName & "|||" & trackArtist & "|||" & trackAlbum & "|||" & trackDuration & "|||" & trackURL
-        end tell
-        '''
-        result = self._run_applescript(script)
+        bridge = self._scripting_bridge()
+        if bridge is not None:
+            if self.get_player_state() == "stopped":
+                return None
+            with self._bridge_lock, _bridge_errors():
+                track = bridge.currentTrack()
+                return TrackInfo(
+                    name=str(track.name()),
+                    artist=str(track.artist()),
+                    album=str(track.album()),
+                    duration_ms=int(track.duration()),
+                    spotify_url=str(track.spotifyUrl())
+                )
+        result = self._run_compiled("current_track")
         
         if result == "STOPPED":
             return None
         
-        parts = result.split("|||")
-        if len(parts) != 5:
-            return None
+        return _parse_track(result.split(_FIELD_SEPARATOR))
+    
+    def wait_until_playing(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for playback to start, polling inside AppleScript.
         
-        return TrackInfo(
-            name=parts[0],
-            artist=parts[1],
-            album=parts[2],
-            duration_ms=int(parts[3]),
-            spotify_url=parts[4]
-        )
+        A running script holds the coprocess, so scripts from other threads
+        (such as the watcher's polls) queue behind it. The wait is split into
+        scripts of at most WAIT_SLICE seconds to let them run in between.
+        """
+        interval = 0.1
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = min(max(deadline - time.monotonic(), 0.0), self.WAIT_SLICE)
+            attempts = max(1, math.ceil(remaining / interval))
+            script = f'''
+            tell application "Spotify"
+                repeat {attempts} times
+                    if player state is playing then
+                        return true
+                    end if
+                    delay {interval}
+                end repeat
+                return player state is playing
+            end tell
+            '''
+            result = self._run_applescript(script, timeout=remaining + _RESPONSE_TIMEOUT)
+            if result.lower() == "true":
+                return True
+            if time.monotonic() >= deadline:
+                return False
+    
+    def get_status_snapshot(self) -> StatusSnapshot:
+        """Get player state, current track and position in a single script."""
+        if self._scripting_bridge() is not None:
+            # Apple Events are cheap enough that separate queries are fine
+            return super().get_status_snapshot()
+        generation = self._cache_generation
+        return self._parse_snapshot(self._run_compiled("status_snapshot"), generation)
+    
+    def get_status_bundle(self) -> Tuple[StatusSnapshot, int]:
+        """Get the status snapshot and the volume in a single round trip."""
+        if self._scripting_bridge() is not None:
+            return super().get_status_bundle()
+        generation = self._cache_generation
+        snapshot_result, volume_result = self._run_applescript_many([
+            self._compiled_invocation("status_snapshot"),
+            self._compiled_invocation("volume"),
+        ])
+        volume = int(volume_result)
+        self._fill_cache(generation, time.monotonic(), {"get_volume": volume})
+        return self._parse_snapshot(snapshot_result, generation), volume
+    
+    def _parse_snapshot(self, result: str, generation: int) -> StatusSnapshot:
+        """
+        Build a StatusSnapshot from the snapshot script's output.
+        
+        Args:
+            result: Output of the status_snapshot script.
+            generation: Cache generation read before the script ran.
+        """
+        parts = result.split(_FIELD_SEPARATOR)
+        state = parts[0].lower()
+        track = _parse_track(parts[2:])
+        
+        # Let the individual getters reuse what this query already fetched
+        self._fill_cache(generation, time.monotonic(), {
+            "get_player_state": state,
+            "get_current_track": track,
+        })
+        
+        if track is None:
+            return StatusSnapshot(state=state)
+        return StatusSnapshot(state=state, track=track, position=float(parts[1]))
     
     def get_track_name(self) -> str:
         """Get the name of the current track."""
-        return self._run_applescript('tell application "Spotify" to name of current track')
+        track = self.get_current_track()
+        return track.name if track else ""
     
     def get_track_artist(self) -> str:
         """Get the artist of the current track."""
-        return self._run_applescript('tell application "Spotify" to artist of current track')
+        track = self.get_current_track()
+        return track.artist if track else ""
     
     def get_track_album(self) -> str:
         """Get the album of the current track."""
-        return self._run_applescript('tell application "Spotify" to album of current track')
+        track = self.get_current_track()
+        return track.album if track else ""
     
     # =========================================================================
     # Play by URI
     # =========================================================================
     
+    @_clears_cache
     def play_track(self, spotify_uri: str) -> None:
         """Play a specific track or playlist by its Spotify URI."""
-        self._run_applescript(f'tell application "Spotify" to play track "{spotify_uri}"')
+        self._run_applescript(f'tell application "Spotify" to play track "{_quote_applescript(spotify_uri)}"')
     
     # =========================================================================
     # Shuffle and Repeat
     # =========================================================================
     
+    @_cached_read
     def is_shuffling(self) -> bool:
         """Check if shuffle is enabled."""
-        result = self._run_applescript('tell application "Spotify" to shuffling')
+        result = self._run_compiled("shuffling")
         return result.lower() == "true"
     
+    @_cached_read
     def is_repeating(self) -> bool:
         """Check if repeat is enabled."""
-        result = self._run_applescript('tell application "Spotify" to repeating')
+        result = self._run_compiled("repeating")
         return result.lower() == "true"
     
+    @_clears_cache
     def set_shuffling(self, enabled: bool) -> None:
         """Set shuffle mode."""
         value = "true" if enabled else "false"
         self._run_applescript(f'tell application "Spotify" to set shuffling to {value}')
     
+    @_clears_cache
     def set_repeating(self, enabled: bool) -> None:
         """Set repeat mode."""
         value = "true" if enabled else "false"
@@ -225,59 +1122,158 @@ class MacOSSpotifyController(SpotifyControllerBase):
     # UI Automation
     # =========================================================================
     
+    @_clears_cache
     def _keystroke(self, key: str, modifiers: Optional[list] = None) -> None:
-        """Send a keystroke to Spotify."""
-        using_clause = ""
-        if modifiers:
-            modifier_str = ", ".join(f"{m} down" for m in modifiers)
-            using_clause = f" using {{{modifier_str}}}"
+        """Send a keystroke to Spotify, waiting inside the script."""
         script = f'''
         tell application "System Events"
             tell process "Spotify"
-                keystroke "{key}"{using_clause}
+                keystroke "{key}"{_using_clause(modifiers)}
+                delay {self.DEFAULT_KEYSTROKE_DELAY}
             end tell
         end tell
         '''
         self._run_applescript(script)
-        time.sleep(self.DEFAULT_KEYSTROKE_DELAY)
 
+    @_clears_cache
     def _key_code(self, code: int, modifiers: Optional[list] = None) -> None:
-        """Send a key code to Spotify."""
-        using_clause = ""
-        if modifiers:
-            modifier_str = ", ".join(f"{m} down" for m in modifiers)
-            using_clause = f" using {{{modifier_str}}}"
+        """Send a key code to Spotify, waiting inside the script."""
         script = f'''
         tell application "System Events"
             tell process "Spotify"
-                key code {code}{using_clause}
+                key code {code}{_using_clause(modifiers)}
+                delay {self.DEFAULT_KEYSTROKE_DELAY}
             end tell
         end tell
         '''
         self._run_applescript(script)
-        time.sleep(self.DEFAULT_KEYSTROKE_DELAY)
     
-    def _type_text(self, text: str, delay_per_char: float = 0.02) -> None:
-        """Type text into Spotify."""
-        escaped = text.replace('\\', '\\\\').replace('"', '\\"')
+    @_clears_cache
+    def _send_key_sequence(
+        self,
+        keys: Sequence[KeyPress],
+        delay: Optional[float] = None,
+        final_delay: Optional[float] = None
+    ) -> None:
+        """Press a sequence of keys in a single script, delaying inside AppleScript."""
+        lines = []
+        for code, modifiers, wait in self._key_sequence_steps(keys, delay, final_delay):
+            lines.append(f"key code {code}{_using_clause(modifiers)}")
+            lines.append(f"delay {wait}")
+        body = "\n                ".join(lines)
         script = f'''
         tell application "System Events"
             tell process "Spotify"
-                keystroke "{escaped}"
+                {body}
             end tell
         end tell
         '''
         self._run_applescript(script)
+    
+    @_clears_cache
+    def _type_text(self, text: str, delay_per_char: float = 0.0) -> None:
+        """
+        Type text into Spotify.
+        
+        Without a per-character delay, text of PASTE_MIN_LENGTH characters
+        or more is pasted through the clipboard, which briefly replaces the
+        user's clipboard contents before restoring them. Text is always typed
+        key by key when delay_per_char is set.
+        """
+        paste = delay_per_char == 0
+        self._run_applescript(self._text_entry_script(text, paste))
         time.sleep(len(text) * delay_per_char + self._ui_delay)
     
+    def _text_entry_script(self, text: str, paste: bool = True) -> str:
+        """
+        Build an AppleScript that enters text into the focused Spotify field.
+        
+        Short text, or any text when paste is False, is typed as a keystroke.
+        Longer text is pasted with Cmd+V: the clipboard is overwritten with
+        the text and its previous contents are restored afterwards.
+        """
+        quoted = _quote_applescript(text)
+        if not paste or len(text) < self.PASTE_MIN_LENGTH:
+            return f'''
+        tell application "System Events"
+            tell process "Spotify"
+                keystroke "{quoted}"
+            end tell
+        end tell
+        '''
+        return f'''
+        set savedClipboard to missing value
+        try
+            set savedClipboard to the clipboard
+        end try
+        set the clipboard to "{quoted}"
+        tell application "System Events"
+            tell process "Spotify"
+                keystroke "v" using {{command down}}
+            end tell
+        end tell
+        delay {self.DEFAULT_KEYSTROKE_DELAY}
+        if savedClipboard is not missing value then
+            set the clipboard to savedClipboard
+        end if
+        '''
+    
+    @_clears_cache
+    def _type_search_query(self, query: str) -> None:
+        """Open the quick search overlay and enter a query in a single script."""
+        script = f'''
+        tell application "Spotify" to activate
+        delay {self._ui_delay}
+        tell application "System Events"
+            tell process "Spotify"
+                keystroke "k" using {{{self._cmd_mod} down}}
+            end tell
+        end tell
+        delay {self.DEFAULT_KEYSTROKE_DELAY + self._ui_delay + 0.3}
+        {self._text_entry_script(query)}
+        '''
+        self._run_applescript(script)
+        time.sleep(self._ui_delay)
+    
+    def _search_has_results(self) -> bool:
+        """
+        Check whether the quick search overlay lists any results.
+        
+        Only the overlay's result list is inspected. Rows elsewhere in the
+        window, like the library sidebar, are always present and would make
+        the check pass before the results have loaded.
+        """
+        script = f'''
+        tell application "System Events"
+            tell process "Spotify"
+                return exists row 1 of {_QUICK_SEARCH_RESULTS}
+            end tell
+        end tell
+        '''
+        try:
+            result = self._run_applescript(script)
+        except AppleScriptError:
+            return False
+        return result.lower() == "true"
+    
+    def _open_search_uri(self, query: str) -> bool:
+        """Open the search page for a query via a spotify:search: URI."""
+        uri = "spotify:search:" + quote(query, safe="")
+        try:
+            self._run_applescript(f'tell application "Spotify" to open location "{uri}"')
+        except AppleScriptError:
+            return False
+        return True
+    
     def play_selected_search_result(self) -> None:
         """Play the selected search result from the beginning and show it."""
         # Turn off shuffle to ensure playback starts from first track
         self.set_shuffling(False)
         time.sleep(0.2)
-        # Shift+Enter plays the highlighted search result
-        self._key_code(self._get_return_key_code(), ["shift"])
-        time.sleep(0.5)
-        # Enter to open/show the playlist
-        self._press_return()
-        time.sleep(0.3)
+        # Shift+Enter plays the highlighted search result, then Enter
+        # opens/shows the playlist
+        self._send_key_sequence(
+            [(self._kc_return, ["shift"]), self._kc_return],
+            delay=0.5,
+            final_delay=0.3
+        )
@@ -1,38 +1,60 @@
 """Data models for Spotify RPA."""
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _spotify_url_to_web(spotify_url: str) -> Optional[str]:
+    """
+    Convert a Spotify URI to a shareable web URL.
+    
+    Converts spotify:track:id to https://open.spotify.com/track/id
+    
+    Polling creates a new TrackInfo for the same track over and over, so
+    conversions are cached by URI.
+    """
+    if not spotify_url:
+        return None
+    
+    # Parse URI format: spotify:type:id
+    parts = spotify_url.split(":")
+    if len(parts) == 3 and parts[0] == "spotify":
+        item_type = parts[1]  # track, album, playlist, etc.
+        item_id = parts[2]
+        return f"https://open.spotify.com/{item_type}/{item_id}"
+    
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class TrackInfo:
-    """Information about a Spotify track."""
+    """
+    Information about a Spotify track.
+    
+    Instances are immutable, so derived values are computed once on
+    creation instead of on every access.
+    """
     name: str
     artist: str
     album: str
     duration_ms: int
     spotify_url: str  # URI format: spotify:track:id
+    
+    # Duration in seconds
+    duration_seconds: float = field(init=False, repr=False, compare=False)
+    # Shareable web URL for the track, or None if the URI is not recognized
+    web_url: Optional[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "duration_seconds", self.duration_ms / 1000)
+        object.__setattr__(self, "web_url", _spotify_url_to_web(self.spotify_url))
 
-    @property
-    def duration_seconds(self) -> float:
-        """Get duration in seconds."""
-        return self.duration_ms / 1000
 
-    @property
-    def web_url(self) -> Optional[str]:
-        """
-        Get shareable web URL for the track.
-        
-        Converts spotify:track:id to https://open.spotify.com/track/id
-        """
-        if not self.spotify_url:
-            return None
-        
-        # Parse URI format: spotify:type:id
-        parts = self.spotify_url.split(":")
-        if len(parts) == 3 and parts[0] == "spotify":
-            item_type = parts[1]  # track, album, playlist, etc.
-            item_id = parts[2]
-            return f"https://open.spotify.com/{item_type}/{item_id}"
-        
-        return None
+@dataclass
+class StatusSnapshot:
+    """Player state, current track and position captured in one query."""
+    state: str  # playing, paused or stopped
+    track: Optional[TrackInfo] = None
+    position: float = 0.0
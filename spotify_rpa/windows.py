@@ -6,6 +6,8 @@ from .base import SpotifyControllerBase
 from .models import TrackInfo
 from .exceptions import AutomationError
 
+__all__ = ["WindowsSpotifyController"]
+
 
 class WindowsSpotifyController(SpotifyControllerBase):
     """
@@ -14,8 +16,9 @@ class WindowsSpotifyController(SpotifyControllerBase):
     TODO: Implement Windows support using rpaframework-windows or similar.
     """
 
+    __slots__ = ()
+
     def __init__(self, debug: bool = False):
-        super().__init__(debug)
         raise AutomationError(
             "Windows support is not yet implemented. "
             "Contributions welcome!"
@@ -119,7 +122,7 @@ class WindowsSpotifyController(SpotifyControllerBase):
     def _key_code(self, code: int, modifiers: Optional[list] = None) -> None:
         raise NotImplementedError("Windows support not implemented")
 
-    def _type_text(self, text: str, delay_per_char: float = 0.02) -> None:
+    def _type_text(self, text: str, delay_per_char: float = 0.0) -> None:
         raise NotImplementedError("Windows support not implemented")
 
     def _get_return_key_code(self) -> int:
@@ -0,0 +1,67 @@
+"""Lightweight test doubles that are cheaper to build than MagicMock."""
+
+import functools
+from typing import Optional
+
+from spotify_rpa.base import SpotifyControllerBase
+from spotify_rpa.models import StatusSnapshot, TrackInfo
+
+
+@functools.lru_cache(maxsize=None)
+def make_track(spotify_url: str = "", duration_ms: int = 0) -> TrackInfo:
+    """
+    Get a TrackInfo with placeholder metadata.
+    
+    TrackInfo is frozen and hashable, so equal arguments can safely share
+    one cached instance.
+    """
+    return TrackInfo(
+        name="Test",
+        artist="Artist",
+        album="Album",
+        duration_ms=duration_ms,
+        spotify_url=spotify_url
+    )
+
+
+class SpotifyStub:
+    """
+    Stand-in for SpotifyRPA that returns canned values.
+    
+    Methods are plain callables and record nothing. Assign a MagicMock to
+    an attribute when a test needs to assert on that method's calls.
+    """
+    
+    __slots__ = (
+        "is_running",
+        "is_playing",
+        "get_player_state",
+        "get_current_track",
+        "get_status_snapshot",
+        "get_volume",
+        "set_volume",
+    )
+    
+    # Waits run the real backoff loop, so they behave as in SpotifyRPA
+    POLL_INITIAL_DELAY = SpotifyControllerBase.POLL_INITIAL_DELAY
+    POLL_MAX_DELAY = SpotifyControllerBase.POLL_MAX_DELAY
+    wait_for = SpotifyControllerBase.wait_for
+    wait_until_playing = SpotifyControllerBase.wait_until_playing
+    
+    def __init__(
+        self,
+        running: bool = True,
+        state: str = "playing",
+        track: Optional[TrackInfo] = None,
+        position: float = 0.0,
+        volume: int = 50,
+    ):
+        playing = state == "playing"
+        snapshot = StatusSnapshot(state=state, track=track, position=position)
+        self.is_running = lambda: running
+        self.is_playing = lambda: playing
+        self.get_player_state = lambda: state
+        self.get_current_track = lambda: track
+        self.get_status_snapshot = lambda: snapshot
+        self.get_volume = lambda: volume
+        self.set_volume = lambda level: None
@@ -2,10 +2,13 @@
 
 import pytest
 import sys
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from spotify_rpa.cli import (
     main,
+    _build_parser,
+    _parse_args_fast,
     print_status,
     verify_playback,
     cmd_play_playlist,
@@ -14,49 +17,102 @@ from spotify_rpa.cli import (
 )
 from spotify_rpa.models import TrackInfo
 
+from ._stubs import SpotifyStub
+
+
+@pytest.fixture
+def cli_env(monkeypatch):
+    """
+    Set up sys.argv and a mocked SpotifyRPA for a main() run.
+    
+    Returns a function taking the argv list (and whether Spotify should
+    report itself running) that returns the mocked class and instance.
+    """
+    def apply(argv, is_running=False):
+        monkeypatch.setattr(sys, "argv", argv)
+        mock_instance = MagicMock()
+        mock_instance.is_running.return_value = is_running
+        mock_cls = MagicMock(return_value=mock_instance)
+        monkeypatch.setattr("spotify_rpa.cli.SpotifyRPA", mock_cls)
+        return mock_cls, mock_instance
+    
+    return apply
+
 
 class TestMainCLI:
     """Tests for main CLI entry point."""
     
-    def test_cli_no_command_shows_help(self, capsys):
+    def test_cli_no_command_shows_help(self, cli_env, capsys):
         """Test running without command shows help."""
-        with patch.object(sys, "argv", ["spotify"]):
-            result = main()
+        cli_env(["spotify"])
         
-        assert result == 0
+        assert main() == 0
         captured = capsys.readouterr()
         assert "Spotify RPA" in captured.out
     
-    def test_cli_help_flag(self):
+    def test_cli_help_flag(self, cli_env):
         """Test --help flag exits with 0."""
-        with patch.object(sys, "argv", ["spotify", "--help"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 0
-    
-    def test_cli_debug_flag_parsed(self):
-        """Test --debug flag is parsed correctly."""
-        with patch.object(sys, "argv", ["spotify", "--debug", "status"]):
-            with patch("spotify_rpa.cli.SpotifyRPA") as mock_spotify:
-                mock_instance = MagicMock()
-                mock_instance.is_running.return_value = False
-                mock_spotify.return_value = mock_instance
-                
-                main()
-                
-                mock_spotify.assert_called_once_with(debug=True)
-    
-    def test_cli_status_command(self):
-        """Test status command."""
-        with patch.object(sys, "argv", ["spotify", "status"]):
-            with patch("spotify_rpa.cli.SpotifyRPA") as mock_spotify:
-                mock_instance = MagicMock()
-                mock_instance.is_running.return_value = False
-                mock_spotify.return_value = mock_instance
-                
-                result = main()
-                
-                assert result == 0
+        cli_env(["spotify", "--help"])
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+    
+    @pytest.mark.parametrize("argv, debug", [
+        (["spotify", "status"], False),
+        (["spotify", "--debug", "status"], True),
+        (["spotify", "-d", "status"], True),
+    ])
+    def test_cli_status_command(self, cli_env, argv, debug):
+        """Test the status command and how --debug is passed on."""
+        mock_cls, _ = cli_env(argv)
+        
+        assert main() == 0
+        mock_cls.assert_called_once_with(debug=debug)
+
+
+class TestFastArgParsing:
+    """Tests for parsing command lines without argparse."""
+    
+    @pytest.mark.parametrize("argv", [
+        ["status"],
+        ["--debug", "status"],
+        ["-d", "next"],
+        ["--fast", "pause"],
+        ["--fast", "--debug", "volume", "30"],
+        ["play-playlist", "Göstän parhaat"],
+        ["search", "artist name"],
+        ["volume"],
+        ["volume", "50"],
+    ])
+    def test_matches_argparse(self, argv):
+        """Test the fast path produces the same arguments as argparse."""
+        assert vars(_parse_args_fast(argv)) == vars(_build_parser().parse_args(argv))
+    
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--help"],
+        ["unknown"],
+        ["status", "extra"],
+        ["play-playlist"],
+        ["volume", "loud"],
+        ["volume", "-h"],
+    ])
+    def test_defers_to_argparse(self, argv):
+        """Test unusual command lines are left to argparse."""
+        assert _parse_args_fast(argv) is None
+
+
+class TestFastFlag:
+    """Tests for the --fast global flag."""
+    
+    def test_fast_flag_disables_is_running_expiry(self, cli_env):
+        """Test --fast makes the is_running() result last for the whole command."""
+        _, mock_instance = cli_env(["spotify", "--fast", "status"])
+        
+        main()
+        
+        mock_instance.set_is_running_ttl.assert_called_once_with(float("inf"))
 
 
 class TestPrintStatus:
@@ -64,30 +120,31 @@ class TestPrintStatus:
     
     def test_print_status_playing(self, capsys):
         """Test print_status when playing."""
-        mock_spotify = MagicMock()
-        mock_spotify.get_player_state.return_value = "playing"
-        mock_spotify.get_current_track.return_value = TrackInfo(
-            name="Test Song",
-            artist="Test Artist",
-            album="Test Album",
-            duration_ms=180000,
-            spotify_url="spotify:track:abc123"
+        stub = SpotifyStub(
+            state="playing",
+            track=TrackInfo(
+                name="Test Song",
+                artist="Test Artist",
+                album="Test Album",
+                duration_ms=180000,
+                spotify_url="spotify:track:abc123"
+            ),
+            position=60.0,
         )
-        mock_spotify.get_player_position.return_value = 60.0
+        stub.get_player_state = MagicMock()
         
-        print_status(mock_spotify)
+        print_status(stub)
         
         captured = capsys.readouterr()
         assert "playing" in captured.out
         assert "Test Song" in captured.out
         assert "Test Artist" in captured.out
+        assert "60s / 180s" in captured.out
+        stub.get_player_state.assert_not_called()
     
     def test_print_status_stopped(self, capsys):
         """Test print_status when stopped."""
-        mock_spotify = MagicMock()
-        mock_spotify.get_player_state.return_value = "stopped"
-        
-        print_status(mock_spotify)
+        print_status(SpotifyStub(state="stopped"))
         
         captured = capsys.readouterr()
         assert "stopped" in captured.out
@@ -99,20 +156,46 @@ class TestVerifyPlayback:
     def test_verify_playback_success(self):
         """Test verify_playback returns True when playing."""
         mock_spotify = MagicMock()
-        mock_spotify.is_playing.return_value = True
+        mock_spotify.wait_until_playing.return_value = True
         
         result = verify_playback(mock_spotify, timeout=1.0)
         
         assert result is True
+        mock_spotify.wait_until_playing.assert_called_once_with(1.0)
     
-    def test_verify_playback_timeout(self):
-        """Test verify_playback returns False on timeout."""
-        mock_spotify = MagicMock()
-        mock_spotify.is_playing.return_value = False
+    def test_verify_playback_timeout(self, frozen_time):
+        """Test verify_playback backs off and returns False at the deadline."""
+        stub = SpotifyStub(state="paused")
+        stub.is_playing = MagicMock(return_value=False)
         
-        result = verify_playback(mock_spotify, timeout=0.5)
+        result = verify_playback(stub, timeout=0.5)
         
         assert result is False
+        assert frozen_time.now == pytest.approx(0.5)
+        assert frozen_time.sleeps == pytest.approx([0.05, 0.1, 0.2, 0.15])
+        assert stub.is_playing.call_count == 5
+    
+    def test_verify_playback_track_changed(self, frozen_time):
+        """Test verify_playback returns as soon as the track changes."""
+        stub = SpotifyStub()
+        stub.get_current_track = MagicMock(side_effect=[
+            TrackInfo("Old Song", "Artist", "Album", 1000, ""),
+            TrackInfo("New Song", "Artist", "Album", 1000, ""),
+        ])
+        
+        result = verify_playback(stub, timeout=1.0, initial_track="Old Song")
+        
+        assert result is True
+        assert stub.get_current_track.call_count == 2
+        assert frozen_time.sleeps == pytest.approx([0.05])
+    
+    def test_verify_playback_track_unchanged_timeout(self, frozen_time):
+        """Test verify_playback falls back to play state when track is unchanged."""
+        result = verify_playback(SpotifyStub(state="paused"), timeout=0.2, initial_track="Old Song")
+        
+        assert result is False
+        assert frozen_time.now == pytest.approx(0.2)
+        assert frozen_time.sleeps == pytest.approx([0.05, 0.1, 0.05])
 
 
 class TestCommandFunctions:
@@ -120,11 +203,7 @@ class TestCommandFunctions:
     
     def test_cmd_status_not_running(self, capsys):
         """Test cmd_status when Spotify not running."""
-        args = MagicMock()
-        mock_spotify = MagicMock()
-        mock_spotify.is_running.return_value = False
-        
-        result = cmd_status(args, mock_spotify)
+        result = cmd_status(SimpleNamespace(), SpotifyStub(running=False))
         
         assert result == 0
         captured = capsys.readouterr()
@@ -132,13 +211,7 @@ class TestCommandFunctions:
     
     def test_cmd_volume_get(self, capsys):
         """Test cmd_volume to get current volume."""
-        args = MagicMock()
-        args.level = None
-        mock_spotify = MagicMock()
-        mock_spotify.is_running.return_value = True
-        mock_spotify.get_volume.return_value = 75
-        
-        result = cmd_volume(args, mock_spotify)
+        result = cmd_volume(SimpleNamespace(level=None), SpotifyStub(volume=75))
         
         assert result == 0
         captured = capsys.readouterr()
@@ -146,12 +219,10 @@ class TestCommandFunctions:
     
     def test_cmd_volume_set(self, capsys):
         """Test cmd_volume to set volume."""
-        args = MagicMock()
-        args.level = 50
-        mock_spotify = MagicMock()
-        mock_spotify.is_running.return_value = True
+        stub = SpotifyStub()
+        stub.set_volume = MagicMock()
         
-        result = cmd_volume(args, mock_spotify)
+        result = cmd_volume(SimpleNamespace(level=50), stub)
         
         assert result == 0
-        mock_spotify.set_volume.assert_called_once_with(50)
+        stub.set_volume.assert_called_once_with(50)
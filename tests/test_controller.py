@@ -1,5 +1,7 @@
 """Tests for spotify_rpa.controller module."""
 
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -10,89 +12,138 @@ from spotify_rpa.exceptions import PlatformNotSupportedError
 class TestGetPlatform:
     """Tests for get_platform function."""
     
-    def test_get_platform_macos(self):
-        """Test platform detection for macOS."""
-        with patch("spotify_rpa.controller.platform.system", return_value="Darwin"):
-            assert get_platform() == "macos"
-    
-    def test_get_platform_windows(self):
-        """Test platform detection for Windows."""
-        with patch("spotify_rpa.controller.platform.system", return_value="Windows"):
-            assert get_platform() == "windows"
+    @pytest.fixture(autouse=True)
+    def clear_platform_cache(self):
+        """Clear the cached platform so each test sees its patched system."""
+        get_platform.cache_clear()
+        yield
+        get_platform.cache_clear()
     
-    def test_get_platform_linux(self):
-        """Test platform detection for Linux."""
-        with patch("spotify_rpa.controller.platform.system", return_value="Linux"):
-            assert get_platform() == "linux"
+    @pytest.mark.parametrize("system_name, expected", [
+        ("Darwin", "macos"),
+        ("Windows", "windows"),
+        ("Linux", "linux"),
+        ("UnknownOS", "unknownos"),
+    ])
+    def test_get_platform(self, system_name, expected):
+        """Test platform detection for each operating system."""
+        with patch("spotify_rpa.controller.platform.system", return_value=system_name):
+            assert get_platform() == expected
     
-    def test_get_platform_unknown(self):
-        """Test platform detection for unknown OS."""
-        with patch("spotify_rpa.controller.platform.system", return_value="UnknownOS"):
-            assert get_platform() == "unknownos"
+    def test_get_platform_is_cached(self):
+        """Test platform detection runs only once."""
+        with patch("spotify_rpa.controller.platform.system", return_value="Darwin") as mock_system:
+            assert get_platform() == "macos"
+            assert get_platform() == "macos"
+        mock_system.assert_called_once()
 
 
 class TestCreateSpotifyController:
     """Tests for create_spotify_controller factory function."""
     
-    def test_create_macos_controller(self):
+    def test_create_macos_controller(self, _macos_controller_cls):
         """Test creating macOS controller."""
-        with patch("spotify_rpa.controller.platform.system", return_value="Darwin"):
-            # Mock the MacOSSpotifyController import
-            with patch.dict("sys.modules", {"spotify_rpa.macos": MagicMock()}):
-                from spotify_rpa.macos import MacOSSpotifyController
-                controller = create_spotify_controller("macos", debug=False)
-                assert controller is not None
+        instance = MagicMock(spec=_macos_controller_cls)
+        with patch("spotify_rpa.macos.MacOSSpotifyController", return_value=instance) as mock_cls:
+            controller = create_spotify_controller("macos", debug=False)
+        
+        assert controller is instance
+        mock_cls.assert_called_once_with(debug=False)
     
     def test_create_unsupported_platform(self):
         """Test creating controller for unsupported platform raises error."""
         with pytest.raises(PlatformNotSupportedError) as exc_info:
             create_spotify_controller("linux", debug=False)
         
-        assert "linux" in str(exc_info.value).lower()
-        assert "not supported" in str(exc_info.value).lower()
+        message = str(exc_info.value).lower()
+        assert "linux" in message
+        assert "not supported" in message
     
-    def test_create_controller_with_debug(self):
+    def test_create_controller_with_debug(self, _macos_controller_cls):
         """Test creating controller with debug flag."""
-        with patch("spotify_rpa.controller.platform.system", return_value="Darwin"):
-            controller = create_spotify_controller("macos", debug=True)
-            assert controller.debug is True
+        instance = MagicMock(spec=_macos_controller_cls)
+        with patch("spotify_rpa.macos.MacOSSpotifyController", return_value=instance) as mock_cls:
+            create_spotify_controller("macos", debug=True)
+        
+        mock_cls.assert_called_once_with(debug=True)
+
+
+@pytest.fixture
+def patched_controller(monkeypatch):
+    """
+    Make SpotifyRPA build a MagicMock controller on "macos".
+    
+    Returns the patched create_spotify_controller; its return_value is the
+    controller and can be replaced before SpotifyRPA is constructed.
+    """
+    mock_create = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr("spotify_rpa.controller.get_platform", lambda: "macos")
+    monkeypatch.setattr("spotify_rpa.controller.create_spotify_controller", mock_create)
+    return mock_create
 
 
 class TestSpotifyRPA:
     """Tests for SpotifyRPA facade class."""
     
-    def test_spotify_rpa_init_detects_platform(self):
+    def test_spotify_rpa_init_detects_platform(self, patched_controller):
         """Test SpotifyRPA detects platform on init."""
-        with patch("spotify_rpa.controller.get_platform", return_value="macos"):
-            with patch("spotify_rpa.controller.create_spotify_controller") as mock_create:
-                mock_controller = MagicMock()
-                mock_create.return_value = mock_controller
-                
-                spotify = SpotifyRPA(debug=False)
-                
-                assert spotify.platform == "macos"
-                mock_create.assert_called_once_with("macos", debug=False)
+        spotify = SpotifyRPA(debug=False)
+        
+        assert spotify.platform == "macos"
+        patched_controller.assert_called_once_with("macos", debug=False)
     
-    def test_spotify_rpa_delegates_to_controller(self):
+    def test_spotify_rpa_delegates_to_controller(self, patched_controller):
         """Test SpotifyRPA delegates method calls to controller."""
-        with patch("spotify_rpa.controller.get_platform", return_value="macos"):
-            with patch("spotify_rpa.controller.create_spotify_controller") as mock_create:
-                mock_controller = MagicMock()
-                mock_controller.play.return_value = None
-                mock_create.return_value = mock_controller
-                
-                spotify = SpotifyRPA()
-                spotify.play()
-                
-                mock_controller.play.assert_called_once()
+        spotify = SpotifyRPA()
+        spotify.play()
+        
+        patched_controller.return_value.play.assert_called_once()
     
-    def test_spotify_rpa_debug_flag(self):
+    def test_spotify_rpa_binds_controller_methods(self, patched_controller):
+        """Test public controller methods are bound onto the instance."""
+        mock_controller = MagicMock(spec=["play", "is_running", "close"])
+        patched_controller.return_value = mock_controller
+        
+        spotify = SpotifyRPA()
+        
+        assert spotify.__dict__["play"] is mock_controller.play
+        assert "is_running" not in spotify.__dict__
+    
+    def test_spotify_rpa_debug_flag(self, patched_controller):
         """Test SpotifyRPA passes debug flag correctly."""
-        with patch("spotify_rpa.controller.get_platform", return_value="macos"):
-            with patch("spotify_rpa.controller.create_spotify_controller") as mock_create:
-                mock_create.return_value = MagicMock()
-                
-                spotify = SpotifyRPA(debug=True)
-                
-                assert spotify.debug is True
-                mock_create.assert_called_once_with("macos", debug=True)
+        spotify = SpotifyRPA(debug=True)
+        
+        assert spotify.debug is True
+        patched_controller.assert_called_once_with("macos", debug=True)
+    
+    def test_spotify_rpa_close_closes_controller(self, patched_controller):
+        """Test SpotifyRPA.close releases the controller's resources."""
+        spotify = SpotifyRPA()
+        spotify.close()
+        
+        patched_controller.return_value.close.assert_called()
+    
+    def test_spotify_rpa_caches_is_running(self, patched_controller, monkeypatch):
+        """Test is_running is only probed again after the TTL expires."""
+        mock_controller = patched_controller.return_value
+        mock_controller.is_running.return_value = True
+        spotify = SpotifyRPA()
+        
+        clock = iter([100.0, 101.0, 103.0])
+        monkeypatch.setattr("spotify_rpa.controller.time", SimpleNamespace(monotonic=lambda: next(clock)))
+        assert spotify.is_running() is True
+        assert spotify.is_running() is True
+        assert spotify.is_running() is True
+        
+        assert mock_controller.is_running.call_count == 2
+    
+    def test_spotify_rpa_launch_invalidates_is_running(self, patched_controller):
+        """Test launching Spotify forces a fresh is_running probe."""
+        mock_controller = patched_controller.return_value
+        mock_controller.is_running.side_effect = [False, True]
+        
+        spotify = SpotifyRPA()
+        assert spotify.is_running() is False
+        spotify.launch()
+        assert spotify.is_running() is True
+        mock_controller.launch.assert_called_once_with()
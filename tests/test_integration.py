@@ -3,26 +3,26 @@
 These tests require an actual Spotify installation and are skipped in CI.
 Run locally with: pytest tests/test_integration.py -v
 Skip in CI with: pytest --skip-integration
+
+All integration tests drive the same Spotify instance, so they share one
+xdist group and run on a single worker under --dist=loadgroup.
 """
 
 import pytest
 import platform
 
-from spotify_rpa import SpotifyRPA, get_platform
+from spotify_rpa import SpotifyRPA
 from spotify_rpa.exceptions import PlatformNotSupportedError
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("spotify")
 class TestSpotifyIntegration:
     """Integration tests that interact with real Spotify application."""
     
     @pytest.fixture(autouse=True)
     def setup(self):
         """Setup for integration tests."""
-        current_platform = get_platform()
-        if current_platform not in ("macos", "windows"):
-            pytest.skip(f"Integration tests not supported on {current_platform}")
-        
         try:
             self.spotify = SpotifyRPA(debug=False)
         except PlatformNotSupportedError:
@@ -64,6 +64,7 @@ class TestSpotifyIntegration:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("spotify")
 class TestPlatformSpecific:
     """Platform-specific integration tests."""
     
@@ -0,0 +1,1026 @@
+"""Tests for spotify_rpa.macos module."""
+
+import asyncio
+import io
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from spotify_rpa.macos import (
+    MacOSSpotifyController,
+    _OsascriptSession,
+    _RESPONSE_TIMEOUT,
+    _compile_script,
+    _four_char_code,
+    _quote_applescript,
+)
+from spotify_rpa.exceptions import AppleScriptError
+from spotify_rpa.models import StatusSnapshot, TrackInfo
+
+
+@pytest.fixture(autouse=True)
+def script_cache(tmp_path, monkeypatch):
+    """Keep compiled scripts out of the user's cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def uncompiled_scripts(monkeypatch):
+    """Run scripts from source, as without osacompile, unless a test compiles them."""
+    monkeypatch.setattr("spotify_rpa.macos._compile_script", lambda name: None)
+
+
+@pytest.fixture(autouse=True)
+def no_scripting_bridge(monkeypatch):
+    """Exercise the AppleScript path even where PyObjC is installed."""
+    monkeypatch.setattr("spotify_rpa.macos._load_scripting_bridge", lambda: None)
+
+
+def repl_echo(result: str, status: str = "OK") -> bytes:
+    """
+    Frame a result like the coprocess does and echo it like ``osascript -i``.
+    
+    The interpreter prints a string result in source form, ``=> "..."``.
+    """
+    payload = ",".join(str(ord(char)) for char in result)
+    return f'=> "<<SPOTIFY_RPA:{status}>>{payload}<<END>>"\n>> '.encode("utf-8")
+
+
+# Echo of the handshake every new coprocess answers before its first script
+HANDSHAKE = repl_echo("")
+
+
+def pipe_readable(stream, timeout):
+    """Report whether unread output is left, as select() would on a pipe."""
+    return stream.tell() < len(stream.getbuffer())
+
+
+class FakeProcess:
+    """Stand-in for an ``osascript -i`` process with canned stdout."""
+    
+    def __init__(self, output: bytes, handshake: bytes = HANDSHAKE):
+        self.stdin = io.BytesIO()
+        self.stdout = io.BytesIO(handshake + output)
+        self.returncode = None
+    
+    def poll(self):
+        return self.returncode
+    
+    def terminate(self):
+        self.returncode = 0
+    
+    def wait(self, timeout=None):
+        return self.returncode
+    
+    def kill(self):
+        self.returncode = -9
+
+
+class ClosedStdin:
+    """Stdin of a coprocess that has died before a script was written."""
+    
+    def write(self, data):
+        raise BrokenPipeError("osascript exited")
+    
+    def close(self):
+        pass
+
+
+class TestOsascriptSession:
+    """Tests for the persistent osascript coprocess."""
+    
+    @pytest.fixture(autouse=True)
+    def readable(self, monkeypatch):
+        """Report the fake stdout as readable; select() needs a real pipe."""
+        monkeypatch.setattr("spotify_rpa.macos._wait_readable", lambda stream, timeout: True)
+    
+    def test_run_returns_framed_result(self):
+        """Test the result between the response markers is returned."""
+        process = FakeProcess(b">> " + repl_echo("playing"))
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            session = _OsascriptSession()
+            assert session.run('tell application "Spotify" to player state') == "playing"
+        
+        handshake, sent = process.stdin.getvalue().decode("utf-8").split("\n", 1)
+        assert handshake == '"<<SPOTIFY_RPA:OK>><<END>>"'
+        assert sent.startswith("run script ")
+        assert sent.endswith("\n")
+        assert sent.count("\n") == 1
+    
+    def test_result_survives_source_form_echo(self):
+        """Test quotes, backslashes and newlines in a result come back intact."""
+        record = "\x1f".join(['Say "hi"', "AC\\DC", "Two\nLines", "180000", "spotify:track:abc"])
+        process = FakeProcess(repl_echo(record))
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            assert _OsascriptSession().run("current track") == record
+    
+    def test_malformed_response_raises(self):
+        """Test a response whose payload is not character ids is rejected."""
+        process = FakeProcess(b'=> "<<SPOTIFY_RPA:OK>>playing<<END>>"\n')
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            with pytest.raises(AppleScriptError, match="Malformed"):
+                _OsascriptSession().run("script")
+        
+        assert process.poll() is not None
+    
+    def test_unanswered_handshake_falls_back(self, monkeypatch):
+        """Test a coprocess that never answers its handshake is not sent the script."""
+        monkeypatch.setattr("spotify_rpa.macos._wait_readable", pipe_readable)
+        process = FakeProcess(b"", handshake=b"")
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=[process, FakeProcess(b"")]), \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed) as mock_run:
+            assert _OsascriptSession().run("script") == "paused"
+        
+        mock_run.assert_called_once()
+        assert process.poll() is not None
+    
+    def test_garbled_handshake_falls_back(self):
+        """Test a coprocess whose output cannot be parsed is not sent the script."""
+        process = FakeProcess(b"", handshake=b'=> "<<SPOTIFY_RPA:OK>>\\<<END>>"\n')
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=[process, FakeProcess(b"")]), \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed) as mock_run:
+            assert _OsascriptSession().run("script") == "paused"
+        
+        mock_run.assert_called_once()
+        assert process.poll() is not None
+    
+    def test_failed_responses_count_toward_giving_up(self, monkeypatch):
+        """Test timeouts after a script was sent eventually switch to one-off runs."""
+        monkeypatch.setattr("spotify_rpa.macos._wait_readable", pipe_readable)
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=lambda *a, **k: FakeProcess(b"")) as mock_popen, \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed) as mock_run:
+            session = _OsascriptSession()
+            for _ in range(_OsascriptSession.MAX_FAILURES):
+                with pytest.raises(AppleScriptError, match="did not respond"):
+                    session.run("script", timeout=0.5)
+            assert session.run("script") == "paused"
+        
+        assert mock_popen.call_count == _OsascriptSession.MAX_FAILURES
+        mock_run.assert_called_once()
+    
+    def test_process_is_reused(self):
+        """Test consecutive scripts share one osascript process."""
+        process = FakeProcess(
+            repl_echo("50") + repl_echo("true")
+        )
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process) as mock_popen:
+            session = _OsascriptSession()
+            session.run("first")
+            session.run("second")
+        
+        mock_popen.assert_called_once()
+    
+    def test_run_raises_on_script_error(self):
+        """Test an in-band error is raised as AppleScriptError."""
+        process = FakeProcess(repl_echo("not allowed", status="ERR"))
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            session = _OsascriptSession()
+            with pytest.raises(AppleScriptError, match="not allowed"):
+                session.run("script")
+    
+    def test_falls_back_when_process_exits(self):
+        """Test a coprocess that cannot take the script falls back to a one-off run."""
+        process = FakeProcess(b"")
+        process.stdin = ClosedStdin()
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process), \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed) as mock_run:
+            session = _OsascriptSession()
+            assert session.run("script") == "paused"
+        
+        mock_run.assert_called_once_with(["osascript", "-e", "script"], capture_output=True, text=True)
+    
+    def test_exit_after_script_was_sent_is_not_retried(self):
+        """Test a script is not run a second time once the coprocess took it."""
+        process = FakeProcess(b"")
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process), \
+                patch("spotify_rpa.macos.subprocess.run") as mock_run:
+            session = _OsascriptSession()
+            with pytest.raises(AppleScriptError, match="exited before responding"):
+                session.run('tell application "Spotify" to next track')
+        
+        mock_run.assert_not_called()
+        assert process.poll() is not None
+    
+    def test_unresponsive_process_is_killed(self, monkeypatch):
+        """Test a hung coprocess is shut down once the deadline passes."""
+        monkeypatch.setattr("spotify_rpa.macos._wait_readable", pipe_readable)
+        process = FakeProcess(b"")
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process), \
+                patch("spotify_rpa.macos.subprocess.run") as mock_run:
+            session = _OsascriptSession()
+            with pytest.raises(AppleScriptError, match="did not respond within 0.5s"):
+                session.run("script", timeout=0.5)
+        
+        mock_run.assert_not_called()
+        assert process.poll() is not None
+    
+    def test_prewarm_starts_process(self):
+        """Test prewarming spawns the coprocess before the first script."""
+        process = FakeProcess(repl_echo("50"))
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process) as mock_popen:
+            session = _OsascriptSession()
+            session.prewarm()
+            mock_popen.assert_called_once()
+            assert session.run("script") == "50"
+        
+        mock_popen.assert_called_once()
+    
+    def test_prewarm_ignores_missing_osascript(self):
+        """Test prewarming without osascript is a no-op."""
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=FileNotFoundError("osascript")):
+            _OsascriptSession().prewarm()
+    
+    def test_dead_process_is_replaced(self):
+        """Test a replacement coprocess is started when one dies."""
+        dead = FakeProcess(b"")
+        dead.stdin = ClosedStdin()
+        fresh = FakeProcess(repl_echo("true"))
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=[dead, fresh]) as mock_popen, \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed):
+            session = _OsascriptSession()
+            assert session.run("first") == "paused"
+            assert mock_popen.call_count == 2
+            assert session.run("second") == "true"
+    
+    def test_broken_coprocess_is_given_up(self):
+        """Test a coprocess that keeps failing is not respawned for every script."""
+        def broken_process(*args, **kwargs):
+            process = FakeProcess(b"")
+            process.stdin = ClosedStdin()
+            return process
+        
+        completed = MagicMock(returncode=0, stdout="paused\n", stderr="")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=broken_process) as mock_popen, \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed) as mock_run:
+            session = _OsascriptSession()
+            for _ in range(3):
+                assert session.run("script") == "paused"
+        
+        assert mock_popen.call_count == 2
+        assert mock_run.call_count == 3
+    
+    def test_compiled_scripts_stay_loaded(self):
+        """Test the invoker is loaded once and compiled scripts run as handler calls."""
+        process = FakeProcess(
+            repl_echo("", status="true")
+            + repl_echo("50")
+            + repl_echo("")
+        )
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            session = _OsascriptSession()
+            assert session.run_compiled("/cache/invoker.scpt", "/cache/volume.scpt", (), "volume") == "50"
+            assert session.run_compiled("/cache/invoker.scpt", "/cache/set_volume.scpt", ("60",), "set") == ""
+        
+        sent = process.stdin.getvalue().decode("utf-8")
+        assert sent.count('load script (POSIX file "/cache/invoker.scpt")') == 1
+        assert 'rpaInvoker\'s invoke("/cache/volume.scpt", {})\n' in sent
+        assert 'rpaInvoker\'s invoke("/cache/set_volume.scpt", {"60"})\n' in sent
+        assert "run script" not in sent
+    
+    def test_invoker_load_failure_runs_source(self):
+        """Test the source is run when the invoker cannot be loaded, without reloading."""
+        process = FakeProcess(
+            repl_echo("", status="false")
+            + repl_echo("1")
+            + repl_echo("2")
+        )
+        with patch("spotify_rpa.macos.subprocess.Popen", return_value=process):
+            session = _OsascriptSession()
+            assert session.run_compiled("/cache/invoker.scpt", "/cache/a.scpt", (), "first") == "1"
+            assert session.run_compiled("/cache/invoker.scpt", "/cache/a.scpt", (), "second") == "2"
+        
+        sent = process.stdin.getvalue().decode("utf-8")
+        assert sent.count("load script") == 1
+        assert "invoke(" not in sent
+        assert sum(line.startswith('run script "') for line in sent.splitlines()) == 2
+    
+    def test_fallback_raises_on_script_error(self):
+        """Test a failing one-off run raises AppleScriptError."""
+        completed = MagicMock(returncode=1, stdout="", stderr="execution error")
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=OSError("no coprocess")), \
+                patch("spotify_rpa.macos.subprocess.run", return_value=completed):
+            session = _OsascriptSession()
+            with pytest.raises(AppleScriptError, match="execution error"):
+                session.run("script")
+    
+    def test_run_raises_when_osascript_missing(self):
+        """Test a missing osascript binary raises AppleScriptError."""
+        with patch("spotify_rpa.macos.subprocess.Popen", side_effect=FileNotFoundError("osascript")), \
+                patch("spotify_rpa.macos.subprocess.run", side_effect=FileNotFoundError("osascript")):
+            session = _OsascriptSession()
+            with pytest.raises(AppleScriptError):
+                session.run("script")
+
+
+class TestQuoting:
+    """Tests for escaping text inside AppleScript string literals."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("plain", "plain"),
+        ('Say "hi"', 'Say \\"hi\\"'),
+        ("back\\slash", "back\\\\slash"),
+        ("two\nlines\ttab", "two\\nlines\\ttab"),
+    ])
+    def test_quote_applescript(self, text, expected):
+        """Test special characters are escaped."""
+        assert _quote_applescript(text) == expected
+    
+    def test_play_track_escapes_uri(self):
+        """Test a URI cannot break out of its string literal."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run:
+            MacOSSpotifyController().play_track('spotify:track:"x')
+        
+        assert 'play track "spotify:track:\\"x"' in mock_run.call_args[0][0]
+
+
+class TestController:
+    """Tests for controller construction."""
+    
+    def test_instances_have_no_dict(self):
+        """Test controller state is held in slots."""
+        controller = MacOSSpotifyController()
+        
+        assert not hasattr(controller, "__dict__")
+        with pytest.raises(AttributeError):
+            controller.unknown_attribute = 1
+    
+    def test_debug_output(self, capsys):
+        """Test scripts are printed only while debug is enabled."""
+        with patch.object(_OsascriptSession, "run", return_value=""):
+            controller = MacOSSpotifyController(debug=True)
+            controller._run_applescript("first script")
+            controller.debug = False
+            controller._run_applescript("second script")
+        
+        output = capsys.readouterr().out
+        assert "[AppleScript] first script..." in output
+        assert "second script" not in output
+
+
+class TestStatusSnapshot:
+    """Tests for the batched status query."""
+    
+    def test_snapshot_parses_single_script_result(self):
+        """Test state, track and position come from one script."""
+        result = "\x1f".join(["playing", "42.5", "Song", "Artist", "Album", "180000", "spotify:track:abc"])
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value=result) as mock_run:
+            snapshot = MacOSSpotifyController().get_status_snapshot()
+        
+        mock_run.assert_called_once()
+        assert snapshot.state == "playing"
+        assert snapshot.track.name == "Song"
+        assert snapshot.track.duration_ms == 180000
+        assert snapshot.position == 42.5
+    
+    def test_snapshot_keeps_empty_trailing_field(self):
+        """Test an empty last field survives output trimming."""
+        result = "\x1f".join(["paused", "1.0", "Song", "Artist", "Album", "180000", ""])
+        with patch.object(_OsascriptSession, "run", return_value=result):
+            snapshot = MacOSSpotifyController().get_status_snapshot()
+        
+        assert snapshot.track.spotify_url == ""
+    
+    def test_snapshot_when_stopped(self):
+        """Test a stopped player yields no track."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="stopped"):
+            snapshot = MacOSSpotifyController().get_status_snapshot()
+        
+        assert snapshot.state == "stopped"
+        assert snapshot.track is None
+
+
+class TestStatusBundle:
+    """Tests for fetching the snapshot and volume together."""
+    
+    RESULT = "\x1f".join(["playing", "42.5", "Song", "Artist", "Album", "180000", "spotify:track:abc"])
+    
+    def test_bundle_is_one_round_trip(self):
+        """Test the snapshot and volume scripts run in one batch."""
+        with patch.object(_OsascriptSession, "run", return_value=f"{self.RESULT}\x1e65\x1e") as mock_run:
+            controller = MacOSSpotifyController()
+            snapshot, volume = controller.get_status_bundle()
+            assert controller.get_volume() == 65
+        
+        mock_run.assert_called_once()
+        assert snapshot.track.name == "Song"
+        assert volume == 65
+    
+    def test_async_bundle(self):
+        """Test the async variant returns the same bundle."""
+        with patch.object(_OsascriptSession, "run", return_value=f"{self.RESULT}\x1e65\x1e"):
+            snapshot, volume = asyncio.run(MacOSSpotifyController().get_status_bundle_async())
+        
+        assert snapshot.state == "playing"
+        assert volume == 65
+
+
+class TestSearch:
+    """Tests for searching via spotify:search: URIs."""
+    
+    def test_search_opens_search_uri(self):
+        """Test search opens an encoded spotify:search: URI instead of typing."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch.object(MacOSSpotifyController, "_type_text") as mock_type:
+            MacOSSpotifyController().search("Göstän parhaat", wait_for_results=False)
+        
+        mock_type.assert_not_called()
+        script = mock_run.call_args[0][0]
+        assert 'open location "spotify:search:G%C3%B6st%C3%A4n%20parhaat"' in script
+    
+    def test_search_falls_back_to_typing(self):
+        """Test search types the query when the URI cannot be opened."""
+        with patch.object(MacOSSpotifyController, "_open_search_uri", return_value=False), \
+                patch.object(MacOSSpotifyController, "_type_search_query") as mock_type:
+            MacOSSpotifyController().search("query", wait_for_results=False)
+        
+        mock_type.assert_called_once_with("query")
+
+
+class TestSearchOverlay:
+    """Tests for opening the quick search overlay."""
+    
+    def test_open_and_type_in_one_script(self):
+        """Test Cmd+K and the query are sent as a single script."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep"):
+            MacOSSpotifyController()._type_search_query("playlist:Chill")
+        
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0]
+        assert script.index('keystroke "k" using {command down}') < script.index('set the clipboard to "playlist:Chill"')
+
+
+class TestSearchWait:
+    """Tests for waiting on search results instead of fixed sleeps."""
+    
+    def test_search_returns_once_results_appear(self):
+        """Test search stops waiting as soon as results are visible."""
+        with patch.object(MacOSSpotifyController, "_open_search_uri", return_value=False), \
+                patch.object(MacOSSpotifyController, "_type_search_query"), \
+                patch.object(MacOSSpotifyController, "_search_has_results", side_effect=[False, True]) as mock_results, \
+                patch("spotify_rpa.base.time.sleep") as mock_sleep:
+            MacOSSpotifyController().search("query")
+        
+        assert mock_results.call_count == 2
+        mock_sleep.assert_called_once_with(MacOSSpotifyController.POLL_INITIAL_DELAY)
+    
+    def test_search_page_is_not_polled(self):
+        """Test the overlay is not polled after opening the search page from a URI."""
+        with patch.object(MacOSSpotifyController, "_open_search_uri", return_value=True), \
+                patch.object(MacOSSpotifyController, "_search_has_results") as mock_results, \
+                patch("spotify_rpa.base.time.sleep") as mock_sleep:
+            MacOSSpotifyController().search("query")
+        
+        mock_results.assert_not_called()
+        mock_sleep.assert_not_called()
+    
+    def test_rows_outside_results_list_do_not_count(self):
+        """Test only rows of the overlay's result list are looked for."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="false") as mock_run:
+            assert MacOSSpotifyController()._search_has_results() is False
+        
+        script = mock_run.call_args[0][0]
+        assert "entire contents" not in script
+        assert "AXRow" not in script
+        assert 'exists row 1 of list 1 of (first group of group 1 of group 1 of front window ' \
+            'whose subrole is "AXApplicationDialog")' in script
+    
+    def test_playlist_waits_full_delay_without_results(self, frozen_time):
+        """Test the playlist flow waits out the search delay when no results show."""
+        with patch.object(MacOSSpotifyController, "is_running", return_value=True), \
+                patch.object(MacOSSpotifyController, "bring_to_front"), \
+                patch.object(MacOSSpotifyController, "_type_search_query"), \
+                patch.object(MacOSSpotifyController, "_search_has_results", return_value=False), \
+                patch.object(MacOSSpotifyController, "play_selected_search_result") as mock_play:
+            MacOSSpotifyController().play_playlist_by_name("playlist:Chill", search_delay=2.0)
+        
+        assert frozen_time.now == pytest.approx(2.0)
+        mock_play.assert_called_once_with()
+
+
+class TestWaitUntilPlaying:
+    """Tests for waiting on playback inside AppleScript."""
+    
+    @staticmethod
+    def repeat_count(script: str) -> int:
+        """Read how many times a wait script polls."""
+        return int(script.split("repeat ", 1)[1].split(" times", 1)[0])
+    
+    def test_returns_when_playback_starts(self):
+        """Test one script polls every 0.1s with a deadline extended by its own wait."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="true") as mock_run:
+            assert MacOSSpotifyController().wait_until_playing(timeout=0.5) is True
+        
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0]
+        assert self.repeat_count(script) == 5
+        assert "delay 0.1" in script
+        assert mock_run.call_args[1]["timeout"] == pytest.approx(0.5 + _RESPONSE_TIMEOUT)
+    
+    def test_long_wait_is_split_into_slices(self, frozen_time):
+        """Test no single script holds the coprocess for longer than WAIT_SLICE."""
+        def run(script, timeout):
+            frozen_time.sleep(self.repeat_count(script) * 0.1)
+            return "false"
+        
+        with patch.object(MacOSSpotifyController, "_run_applescript", side_effect=run) as mock_run:
+            assert MacOSSpotifyController().wait_until_playing(timeout=2.5) is False
+        
+        scripts = [call[0][0] for call in mock_run.call_args_list]
+        assert [self.repeat_count(script) for script in scripts] == [10, 10, 5]
+        timeouts = [call[1]["timeout"] for call in mock_run.call_args_list]
+        assert timeouts == pytest.approx([1.0 + _RESPONSE_TIMEOUT, 1.0 + _RESPONSE_TIMEOUT, 0.5 + _RESPONSE_TIMEOUT])
+        assert frozen_time.now == pytest.approx(2.5)
+
+
+class TestTypeText:
+    """Tests for typing text into Spotify."""
+    
+    def test_long_text_is_pasted(self):
+        """Test long text goes through the clipboard in one script."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep"):
+            MacOSSpotifyController()._type_text('Say "hello"')
+        
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0]
+        assert 'set the clipboard to "Say \\"hello\\""' in script
+        assert "set the clipboard to savedClipboard" in script
+    
+    def test_short_text_is_typed(self):
+        """Test short text is sent as a keystroke."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep"):
+            MacOSSpotifyController()._type_text("abc")
+        
+        assert 'keystroke "abc"' in mock_run.call_args[0][0]
+    
+    def test_typing_has_no_per_character_delay(self):
+        """Test typed text only waits for the UI delay by default."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value=""), \
+                patch("spotify_rpa.macos.time.sleep") as mock_sleep:
+            controller = MacOSSpotifyController()
+            controller._type_text("abc")
+        
+        mock_sleep.assert_called_once_with(controller._ui_delay)
+    
+    def test_per_character_delay_types_long_text(self):
+        """Test a per-character delay types long text instead of pasting it."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep") as mock_sleep:
+            controller = MacOSSpotifyController()
+            controller._type_text("hello", delay_per_char=0.02)
+        
+        script = mock_run.call_args[0][0]
+        assert 'keystroke "hello"' in script
+        assert "clipboard" not in script
+        mock_sleep.assert_called_once_with(pytest.approx(5 * 0.02 + controller._ui_delay))
+
+
+class TestCompiledScripts:
+    """Tests for running precompiled scripts."""
+    
+    def test_runs_compiled_file_with_parameters(self):
+        """Test compiled scripts run through the invoker with string parameters."""
+        with patch("spotify_rpa.macos._compile_script", side_effect=lambda name: f"/cache/{name}.scpt") as mock_compile, \
+                patch.object(_OsascriptSession, "run_compiled", return_value="") as mock_run:
+            controller = MacOSSpotifyController()
+            controller.set_volume(50)
+            controller.set_volume(60)
+        
+        assert [c.args[0] for c in mock_compile.call_args_list] == ["set_volume", "invoker"]
+        mock_run.assert_called_with(
+            "/cache/invoker.scpt",
+            "/cache/set_volume.scpt",
+            ("60",),
+            'run script (POSIX file "/cache/set_volume.scpt") with parameters {"60"}',
+        )
+    
+    def test_falls_back_to_source(self):
+        """Test the script source is run when compilation is unavailable."""
+        with patch("spotify_rpa.macos._compile_script", return_value=None), \
+                patch.object(MacOSSpotifyController, "_run_applescript", return_value="Playing") as mock_run:
+            state = MacOSSpotifyController().get_player_state()
+        
+        assert state == "playing"
+        assert mock_run.call_args[0][0].startswith('run script "tell application \\"Spotify\\"')
+    
+    def test_is_running_uses_compiled_script(self):
+        """Test the process check runs from its precompiled script."""
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value="true") as mock_run:
+            assert MacOSSpotifyController().is_running() is True
+        
+        mock_run.assert_called_once_with("is_running")
+    
+    def test_compile_failure_returns_none(self):
+        """Test a missing osacompile leaves scripts uncompiled."""
+        with patch("spotify_rpa.macos.subprocess.run", side_effect=FileNotFoundError("osacompile")):
+            assert _compile_script("next_track") is None
+
+
+class TestTrackInfo:
+    """Tests for fetching track information in one script."""
+    
+    def test_track_getters_share_one_record(self):
+        """Test per-field getters read the batched track record."""
+        record = "\x1f".join(["Song", "Artist", "Album", "180000", "spotify:track:abc"])
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value=record) as mock_run:
+            controller = MacOSSpotifyController()
+            assert controller.get_track_name() == "Song"
+            assert controller.get_track_artist() == "Artist"
+            assert controller.get_track_album() == "Album"
+        
+        assert {c.args for c in mock_run.call_args_list} == {("current_track",)}
+    
+    def test_track_getters_when_stopped(self):
+        """Test per-field getters return empty strings when stopped."""
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value="STOPPED"):
+            assert MacOSSpotifyController().get_track_name() == ""
+
+
+class TestKeySequence:
+    """Tests for sending several keys in one script."""
+    
+    def test_key_sequence_is_one_script(self):
+        """Test keys and delays are combined into a single script."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run:
+            MacOSSpotifyController()._send_key_sequence([(36, ["shift"]), 48], delay=0.2)
+        
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0]
+        assert "key code 36 using {shift down}" in script
+        assert "key code 48\n" in script
+        assert script.count("delay 0.2") == 2
+    
+    def test_play_selected_result_keeps_short_final_delay(self):
+        """Test Shift+Enter waits 0.5s and the final Enter only 0.3s."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep"):
+            MacOSSpotifyController().play_selected_search_result()
+        
+        script = mock_run.call_args[0][0]
+        delays = [line.strip() for line in script.splitlines() if "delay" in line]
+        assert delays == ["delay 0.5", "delay 0.3"]
+    
+    def test_key_code_delays_inside_script(self):
+        """Test a single key waits in AppleScript rather than in Python."""
+        with patch.object(MacOSSpotifyController, "_run_applescript", return_value="") as mock_run, \
+                patch("spotify_rpa.macos.time.sleep") as mock_sleep:
+            MacOSSpotifyController()._key_code(36)
+        
+        assert f"delay {MacOSSpotifyController.DEFAULT_KEYSTROKE_DELAY}" in mock_run.call_args[0][0]
+        mock_sleep.assert_not_called()
+
+
+class TestBatch:
+    """Tests for running several scripts in one round trip."""
+    
+    def test_batch_runs_one_script_and_splits_results(self):
+        """Test batched scripts share one call and return outputs in order."""
+        with patch.object(_OsascriptSession, "run", return_value="\x1eplaying\x1e") as mock_run:
+            results = MacOSSpotifyController().batch(
+                'tell application "Spotify" to play',
+                'tell application "Spotify" to player state as string',
+            )
+        
+        mock_run.assert_called_once()
+        assert results == ["", "playing"]
+        assert '"tell application \\"Spotify\\" to play"' in mock_run.call_args[0][0]
+    
+    def test_batch_empty(self):
+        """Test an empty batch does not run anything."""
+        with patch.object(_OsascriptSession, "run") as mock_run:
+            assert MacOSSpotifyController().batch() == []
+        mock_run.assert_not_called()
+
+
+class TestReadCache:
+    """Tests for short-lived caching of read-only queries."""
+    
+    def test_repeated_reads_share_one_query(self):
+        """Test back-to-back reads reuse the first result."""
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value="playing") as mock_run:
+            controller = MacOSSpotifyController()
+            assert controller.is_playing() is True
+            assert controller.get_player_state() == "playing"
+        
+        mock_run.assert_called_once_with("player_state")
+    
+    def test_reads_expire_after_ttl(self):
+        """Test cached values are refreshed once the TTL has passed."""
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value="paused") as mock_run, \
+                patch("spotify_rpa.macos.time.monotonic", side_effect=[10.0, 10.1, 10.5]):
+            controller = MacOSSpotifyController()
+            controller.get_player_state()
+            controller.get_player_state()
+            controller.get_player_state()
+        
+        assert mock_run.call_count == 2
+    
+    def test_commands_clear_cache(self):
+        """Test a playback command forces the next read to query again."""
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value="paused") as mock_run:
+            controller = MacOSSpotifyController()
+            controller.get_player_state()
+            controller.play()
+            controller.get_player_state()
+        
+        assert [c.args[0] for c in mock_run.call_args_list] == ["player_state", "play", "player_state"]
+    
+    def test_snapshot_fills_cache(self):
+        """Test the batched snapshot primes the state and track getters."""
+        result = "\x1f".join(["playing", "42.5", "Song", "Artist", "Album", "180000", "spotify:track:abc"])
+        with patch.object(MacOSSpotifyController, "_run_compiled", return_value=result) as mock_run:
+            controller = MacOSSpotifyController()
+            controller.get_status_snapshot()
+            assert controller.get_player_state() == "playing"
+            assert controller.get_track_name() == "Song"
+        
+        mock_run.assert_called_once_with("status_snapshot")
+    
+    def test_read_overlapping_command_is_not_cached(self):
+        """Test a read that a command overtook does not leave a stale value behind."""
+        controller = MacOSSpotifyController()
+        
+        def run(name, *args):
+            if name == "player_state" and mock_run.call_count == 1:
+                # Another thread's command lands while this read is in flight
+                controller.play()
+                return "paused"
+            return "playing"
+        
+        with patch.object(MacOSSpotifyController, "_run_compiled", side_effect=run) as mock_run:
+            assert controller.get_player_state() == "paused"
+            assert controller.get_player_state() == "playing"
+        
+        assert [c.args[0] for c in mock_run.call_args_list] == ["player_state", "play", "player_state"]
+    
+    def test_snapshot_overlapping_command_is_not_cached(self):
+        """Test a snapshot that a command overtook does not prime the getters."""
+        controller = MacOSSpotifyController()
+        result = "\x1f".join(["paused", "42.5", "Song", "Artist", "Album", "180000", "spotify:track:abc"])
+        
+        def run(name, *args):
+            if name == "status_snapshot":
+                controller.play()
+                return result
+            return "playing"
+        
+        with patch.object(MacOSSpotifyController, "_run_compiled", side_effect=run):
+            assert controller.get_status_snapshot().state == "paused"
+            assert controller.get_player_state() == "playing"
+
+
+class TestScriptingBridge:
+    """Tests for the in-process ScriptingBridge fast path."""
+    
+    @pytest.fixture
+    def loader(self, monkeypatch):
+        loader = MagicMock(return_value=MagicMock())
+        monkeypatch.setattr("spotify_rpa.macos._load_scripting_bridge", loader)
+        return loader
+    
+    @pytest.fixture
+    def bridge(self, loader):
+        return loader.return_value
+    
+    def test_bridge_is_loaded_on_first_use(self, loader, bridge):
+        """Test PyObjC is not imported until a command needs it."""
+        controller = MacOSSpotifyController()
+        loader.assert_not_called()
+        
+        controller.play()
+        controller.pause()
+        
+        loader.assert_called_once_with()
+        bridge.pause.assert_called_once_with()
+    
+    def test_bridge_errors_raise_applescript_error(self, bridge):
+        """Test a nil current track is reported like an AppleScript failure."""
+        bridge.playerState.return_value = _four_char_code("kPSP")
+        bridge.currentTrack.return_value = None
+        controller = MacOSSpotifyController()
+        
+        with pytest.raises(AppleScriptError, match="ScriptingBridge call failed"):
+            controller.get_current_track()
+    
+    def test_failed_command_raises_applescript_error(self, bridge):
+        """Test a failed Apple Event is reported like an AppleScript failure."""
+        bridge.nextTrack.side_effect = TypeError("Apple Event failed")
+        
+        with pytest.raises(AppleScriptError, match="Apple Event failed"):
+            MacOSSpotifyController().next_track()
+    
+    def test_bridge_calls_hold_lock(self, bridge):
+        """Test no other thread can use the bridge while a call is in flight."""
+        controller = MacOSSpotifyController()
+        acquired = []
+        
+        def try_lock():
+            acquired.append(controller._bridge_lock.acquire(blocking=False))
+        
+        def play():
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+        
+        bridge.play.side_effect = play
+        controller.play()
+        
+        assert acquired == [False]
+    
+    def test_commands_use_bridge(self, bridge):
+        """Test playback commands skip AppleScript entirely."""
+        with patch.object(MacOSSpotifyController, "_run_applescript") as mock_run:
+            controller = MacOSSpotifyController()
+            controller.play()
+            controller.next_track()
+            controller.set_volume(40)
+        
+        bridge.play.assert_called_once()
+        bridge.nextTrack.assert_called_once()
+        bridge.setSoundVolume_.assert_called_once_with(40)
+        mock_run.assert_not_called()
+    
+    def test_player_state_maps_enum_codes(self, bridge):
+        """Test the player state enum is mapped to its name."""
+        bridge.playerState.return_value = _four_char_code("kPSp")
+        controller = MacOSSpotifyController()
+        
+        assert controller.get_player_state() == "paused"
+    
+    def test_current_track_read_from_bridge(self, bridge):
+        """Test track fields are read from the bridge without parsing."""
+        bridge.playerState.return_value = _four_char_code("kPSP")
+        track = bridge.currentTrack.return_value
+        track.name.return_value = "Song"
+        track.artist.return_value = "Artist"
+        track.album.return_value = "Album"
+        track.duration.return_value = 180000
+        track.spotifyUrl.return_value = "spotify:track:abc"
+        controller = MacOSSpotifyController()
+        
+        info = controller.get_current_track()
+        
+        assert info.name == "Song"
+        assert info.duration_ms == 180000
+        assert info.spotify_url == "spotify:track:abc"
+    
+    def test_stopped_has_no_track(self, bridge):
+        """Test no track is returned while stopped."""
+        bridge.playerState.return_value = _four_char_code("kPSS")
+        controller = MacOSSpotifyController()
+        
+        assert controller.get_current_track() is None
+        bridge.currentTrack.assert_not_called()
+
+
+class TestWatcher:
+    """Tests for the background change watcher."""
+    
+    FIRST = TrackInfo("One", "Artist", "Album", 1000, "spotify:track:one")
+    SECOND = TrackInfo("Two", "Artist", "Album", 1000, "spotify:track:two")
+    
+    def test_callbacks_receive_changes(self):
+        """Test callbacks run once per change, not once per poll."""
+        snapshots = iter([
+            StatusSnapshot("playing", self.FIRST, 1.0),
+            StatusSnapshot("playing", self.FIRST, 2.0),
+            StatusSnapshot("playing", self.SECOND, 0.0),
+        ])
+        last = StatusSnapshot("paused", self.SECOND, 0.0)
+        seen = []
+        done = threading.Event()
+        
+        def callback(snapshot):
+            seen.append(snapshot)
+            if snapshot.state == "paused":
+                done.set()
+        
+        with patch.object(MacOSSpotifyController, "get_status_snapshot",
+                          side_effect=lambda: next(snapshots, last)):
+            controller = MacOSSpotifyController()
+            controller.add_watch_callback(callback)
+            controller.start_watcher(interval=0.01)
+            assert done.wait(timeout=2.0)
+            controller.close()
+        
+        assert [(snapshot.state, snapshot.track) for snapshot in seen] == [
+            ("playing", self.SECOND),
+            ("paused", self.SECOND),
+        ]
+    
+    def test_wait_returns_on_track_change(self):
+        """Test waiting returns once the watcher sees a new track."""
+        waiting = threading.Event()
+        
+        class SignallingCondition(threading.Condition):
+            def wait_for(self, predicate, timeout=None):
+                waiting.set()
+                return super().wait_for(predicate, timeout)
+        
+        snapshots = iter([StatusSnapshot("playing", self.FIRST, 1.0)])
+        
+        def poll():
+            # Hold back the new track until the waiter has sampled the count
+            snapshot = next(snapshots, None)
+            if snapshot is None:
+                waiting.wait()
+                snapshot = StatusSnapshot("playing", self.SECOND, 0.0)
+            return snapshot
+        
+        with patch.object(MacOSSpotifyController, "get_status_snapshot", side_effect=poll):
+            controller = MacOSSpotifyController()
+            controller._watch_condition = SignallingCondition()
+            controller.start_watcher(interval=0.01)
+            assert controller.wait_for_track_change(timeout=2.0) is True
+            controller.close()
+    
+    def test_wait_times_out_without_change(self):
+        """Test waiting gives up when the track stays the same."""
+        snapshot = StatusSnapshot("playing", self.FIRST, 1.0)
+        with patch.object(MacOSSpotifyController, "get_status_snapshot", return_value=snapshot):
+            controller = MacOSSpotifyController()
+            controller.start_watcher(interval=0.01)
+            assert controller.wait_for_track_change(timeout=0.1) is False
+            controller.close()
+        
+        assert controller._watcher is None
+    
+    def test_poll_errors_are_ignored(self):
+        """Test a failing poll does not stop the watcher."""
+        snapshots = iter([
+            StatusSnapshot("playing", self.FIRST, 1.0),
+            AppleScriptError("busy"),
+        ])
+        
+        def poll():
+            value = next(snapshots, StatusSnapshot("playing", self.SECOND, 0.0))
+            if isinstance(value, Exception):
+                raise value
+            return value
+        
+        with patch.object(MacOSSpotifyController, "get_status_snapshot", side_effect=poll):
+            controller = MacOSSpotifyController()
+            controller.start_watcher(interval=0.01)
+            assert controller.wait_for_track_change(timeout=2.0) is True
+            controller.close()
+    
+    def test_unexpected_errors_do_not_stop_watcher(self):
+        """Test failing polls and callbacks are logged and polling goes on."""
+        snapshots = iter([
+            StatusSnapshot("playing", self.FIRST, 1.0),
+            TypeError("nil track"),
+            StatusSnapshot("playing", self.SECOND, 0.0),
+        ])
+        last = StatusSnapshot("paused", self.SECOND, 0.0)
+        seen = []
+        done = threading.Event()
+        
+        def poll():
+            value = next(snapshots, last)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        
+        def failing_callback(snapshot):
+            raise ZeroDivisionError
+        
+        def callback(snapshot):
+            seen.append(snapshot.state)
+            if snapshot.state == "paused":
+                done.set()
+        
+        with patch.object(MacOSSpotifyController, "get_status_snapshot", side_effect=poll):
+            controller = MacOSSpotifyController()
+            controller.add_watch_callback(failing_callback)
+            controller.add_watch_callback(callback)
+            controller.start_watcher(interval=0.01)
+            assert done.wait(timeout=2.0)
+            controller.close()
+        
+        assert seen == ["playing", "paused"]
+    
+    def test_stop_does_not_wait_for_stuck_poll(self):
+        """Test closing gives up on a poll that never returns."""
+        stuck = threading.Event()
+        release = threading.Event()
+        
+        def poll():
+            stuck.set()
+            release.wait()
+            return StatusSnapshot("stopped")
+        
+        with patch.object(MacOSSpotifyController, "get_status_snapshot", side_effect=poll):
+            controller = MacOSSpotifyController()
+            controller.start_watcher(interval=0.01)
+            assert stuck.wait(timeout=2.0)
+            controller.close()
+            release.set()
+        
+        assert controller._watcher is None
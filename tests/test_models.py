@@ -1,7 +1,9 @@
 """Tests for spotify_rpa.models module."""
 
 import pytest
-from spotify_rpa.models import TrackInfo
+from spotify_rpa.models import TrackInfo, _spotify_url_to_web
+
+from ._stubs import make_track
 
 
 class TestTrackInfo:
@@ -23,92 +25,54 @@ class TestTrackInfo:
         assert track.duration_ms == 180000
         assert track.spotify_url == "spotify:track:abc123"
     
-    def test_duration_seconds_property(self):
+    @pytest.mark.parametrize("duration_ms, expected", [
+        (180000, 180.0),
+        (0, 0.0),
+    ])
+    def test_duration_seconds(self, duration_ms, expected):
         """Test duration_seconds conversion."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=180000,
-            spotify_url=""
-        )
-        
-        assert track.duration_seconds == 180.0
-    
-    def test_duration_seconds_zero(self):
-        """Test duration_seconds with zero duration."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url=""
-        )
-        
-        assert track.duration_seconds == 0.0
-    
-    def test_web_url_track(self):
-        """Test web_url conversion for tracks."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url="spotify:track:abc123def456"
-        )
-        
-        assert track.web_url == "https://open.spotify.com/track/abc123def456"
-    
-    def test_web_url_album(self):
-        """Test web_url conversion for albums."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url="spotify:album:xyz789"
-        )
-        
-        assert track.web_url == "https://open.spotify.com/album/xyz789"
+        assert make_track(duration_ms=duration_ms).duration_seconds == expected
     
-    def test_web_url_playlist(self):
-        """Test web_url conversion for playlists."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url="spotify:playlist:playlist123"
-        )
-        
-        assert track.web_url == "https://open.spotify.com/playlist/playlist123"
+    @pytest.mark.parametrize("spotify_url, expected", [
+        ("spotify:track:abc123def456", "https://open.spotify.com/track/abc123def456"),
+        ("spotify:album:xyz789", "https://open.spotify.com/album/xyz789"),
+        ("spotify:playlist:playlist123", "https://open.spotify.com/playlist/playlist123"),
+        ("", None),
+        ("invalid:url", None),
+    ])
+    def test_web_url(self, spotify_url, expected):
+        """Test web_url conversion from Spotify URIs."""
+        assert make_track(spotify_url).web_url == expected
     
-    def test_web_url_empty(self):
-        """Test web_url with empty spotify_url."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url=""
-        )
+    def test_web_url_parse_is_shared(self):
+        """Test tracks with the same URI reuse one cached conversion."""
+        _spotify_url_to_web.cache_clear()
+        first = TrackInfo("A", "Artist", "Album", 0, "spotify:track:shared")
+        second = TrackInfo("B", "Artist", "Album", 0, "spotify:track:shared")
         
-        assert track.web_url is None
-    
-    def test_web_url_invalid_format(self):
-        """Test web_url with invalid spotify_url format."""
-        track = TrackInfo(
-            name="Test",
-            artist="Artist",
-            album="Album",
-            duration_ms=0,
-            spotify_url="invalid:url"
-        )
-        
-        assert track.web_url is None
+        assert first.web_url == second.web_url
+        assert _spotify_url_to_web.cache_info().hits == 1
     
     def test_track_info_with_fixture(self, sample_track):
         """Test using the sample_track fixture."""
         assert sample_track.name == "Test Song"
         assert sample_track.duration_seconds == 180.0
         assert sample_track.web_url == "https://open.spotify.com/track/abc123def456"
+    
+    def test_track_info_is_immutable(self, sample_track):
+        """Test TrackInfo fields cannot be reassigned."""
+        with pytest.raises(AttributeError):
+            sample_track.name = "Other"
+    
+    def test_track_info_is_hashable(self, sample_track):
+        """Test equal tracks hash alike so they can be used as keys."""
+        copy = TrackInfo(
+            name=sample_track.name,
+            artist=sample_track.artist,
+            album=sample_track.album,
+            duration_ms=sample_track.duration_ms,
+            spotify_url=sample_track.spotify_url
+        )
+        
+        assert copy == sample_track
+        assert {sample_track: 1}[copy] == 1